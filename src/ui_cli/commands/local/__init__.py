@@ -1,8 +1,10 @@
 """Local controller commands - ./ui local or ./ui lo."""
 
+import importlib
 from typing import Annotated
 
 import typer
+from typer.core import TyperGroup
 
 from ui_cli.commands.local.utils import QUICK_TIMEOUT, get_timeout, run_with_spinner, set_timeout_override, spinner
 
@@ -10,8 +12,42 @@ from ui_cli.commands.local.utils import QUICK_TIMEOUT, get_timeout, run_with_spi
 __all__ = ["app", "get_timeout", "run_with_spinner", "spinner", "QUICK_TIMEOUT"]
 
 
+# Subcommand name -> module path, imported only when the subcommand is dispatched
+_SUBCOMMANDS = {
+    "clients": "ui_cli.commands.local.clients",
+    "config": "ui_cli.commands.local.config",
+    "dashboard": "ui_cli.commands.local.dashboard",
+    "devices": "ui_cli.commands.local.devices",
+    "dpi": "ui_cli.commands.local.dpi",
+    "events": "ui_cli.commands.local.events",
+    "firewall": "ui_cli.commands.local.firewall",
+    "health": "ui_cli.commands.local.health",
+    "networks": "ui_cli.commands.local.networks",
+    "portfwd": "ui_cli.commands.local.portfwd",
+    "stats": "ui_cli.commands.local.stats",
+    "vouchers": "ui_cli.commands.local.vouchers",
+}
+
+
+class LazyLocalGroup(TyperGroup):
+    """Command group that imports local subcommand modules on first use."""
+
+    def list_commands(self, ctx) -> list[str]:
+        names = super().list_commands(ctx)
+        return names + [name for name in _SUBCOMMANDS if name not in names]
+
+    def get_command(self, ctx, cmd_name: str):
+        if cmd_name in _SUBCOMMANDS and cmd_name not in self.commands:
+            module = importlib.import_module(_SUBCOMMANDS[cmd_name])
+            command = typer.main.get_group(module.app)
+            command.name = cmd_name
+            self.add_command(command, cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
 app = typer.Typer(
     name="local",
+    cls=LazyLocalGroup,
     help="Local UniFi Controller commands (UDM, Cloud Key, self-hosted)",
     no_args_is_help=True,
 )
@@ -42,19 +78,3 @@ def local_callback(
     elif timeout is not None:
         set_timeout_override(timeout)
 
-
-# Import subcommands after app is defined to avoid circular imports
-from ui_cli.commands.local import clients, config, devices, dpi, events, firewall, health, networks, portfwd, stats, vouchers
-
-# Register subcommands
-app.add_typer(clients.app, name="clients")
-app.add_typer(config.app, name="config")
-app.add_typer(devices.app, name="devices")
-app.add_typer(dpi.app, name="dpi")
-app.add_typer(events.app, name="events")
-app.add_typer(firewall.app, name="firewall")
-app.add_typer(health.app, name="health")
-app.add_typer(networks.app, name="networks")
-app.add_typer(portfwd.app, name="portfwd")
-app.add_typer(stats.app, name="stats")
-app.add_typer(vouchers.app, name="vouchers")
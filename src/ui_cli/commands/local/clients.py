@@ -1,21 +1,36 @@
 """Client commands for local controller."""
 
 import asyncio
+import bisect
+import re
+from collections import Counter
+from enum import Enum
 from typing import Annotated
 
 import typer
 
-from ui_cli.commands.local.utils import run_with_spinner
-from ui_cli.local_client import (
-    LocalAPIError,
-    LocalAuthenticationError,
-    LocalConnectionError,
-    UniFiLocalClient,
+from ui_cli.commands.local.utils import handle_local_errors, run_sync, run_with_spinner
+from ui_cli.local_client import LocalAPIError, UniFiLocalClient
+from ui_cli.name_cache import ClientNameCache
+from ui_cli.output import (
+    OutputFormat,
+    console,
+    output_count_table,
+    output_csv,
+    output_json,
+    output_json_stream,
+    output_table,
 )
-from ui_cli.output import OutputFormat, console, output_count_table, output_csv, output_json, output_table
 
 app = typer.Typer(help="Manage connected clients")
 
+# MAC formats: AA:BB:CC:DD:EE:FF or AA-BB-CC-DD-EE-FF or AABBCCDDEEFF
+_MAC_RE = re.compile(
+    r"(?:[0-9A-Fa-f]{2}:){5}[0-9A-Fa-f]{2}"
+    r"|(?:[0-9A-Fa-f]{2}-){5}[0-9A-Fa-f]{2}"
+    r"|[0-9A-Fa-f]{12}"
+)
+
 
 # Column definitions for client output: (key, header)
 CLIENT_COLUMNS = [
@@ -43,132 +58,144 @@ CLIENT_COLUMNS_VERBOSE = [
 ]
 
 
-def format_client(client: dict, verbose: bool = False) -> dict:
-    """Format raw client data for display."""
-    # Determine connection type
-    is_wired = client.get("is_wired", False)
-    conn_type = "Wired" if is_wired else "Wireless"
+def _client_signal(client: dict) -> str:
+    """Signal strength (wireless only)."""
+    if client.get("is_wired", False):
+        return ""
+    rssi = client.get("rssi")
+    return f"{rssi} dBm" if rssi is not None else ""
 
-    # Get network name
-    network = client.get("network", client.get("essid", ""))
 
-    # Format signal strength (wireless only)
-    signal = ""
-    if not is_wired:
-        rssi = client.get("rssi")
-        if rssi is not None:
-            signal = f"{rssi} dBm"
-
-    # Format experience/satisfaction score
+def _client_satisfaction(client: dict) -> str:
+    """Experience/satisfaction score."""
     satisfaction = client.get("satisfaction")
-    if satisfaction is not None:
-        satisfaction = f"{satisfaction}%"
-    else:
-        satisfaction = ""
+    return f"{satisfaction}%" if satisfaction is not None else ""
 
-    # Format uptime
-    uptime_seconds = client.get("uptime", 0)
-    if uptime_seconds:
-        hours, remainder = divmod(uptime_seconds, 3600)
-        minutes, _ = divmod(remainder, 60)
-        uptime = f"{int(hours)}h {int(minutes)}m"
-    else:
-        uptime = ""
-
-    # Format rates (in Mbps)
-    tx_rate = client.get("tx_rate", 0)
-    rx_rate = client.get("rx_rate", 0)
-    tx_rate_str = f"{tx_rate / 1000:.0f} Mbps" if tx_rate else ""
-    rx_rate_str = f"{rx_rate / 1000:.0f} Mbps" if rx_rate else ""
-
-    result = {
-        "name": client.get("name") or client.get("hostname") or "(unknown)",
-        "mac": client.get("mac", "").upper(),
-        "ip": client.get("ip", ""),
-        "network": network,
-        "type": conn_type,
-        "oui": client.get("oui", ""),
-        "signal": signal,
-        "satisfaction": satisfaction,
-        "tx_rate": tx_rate_str,
-        "rx_rate": rx_rate_str,
-        "uptime": uptime,
-    }
 
-    return result
+def _client_uptime(client: dict) -> str:
+    """Uptime as hours and minutes."""
+    uptime_seconds = client.get("uptime", 0)
+    if not uptime_seconds:
+        return ""
+    hours, remainder = divmod(uptime_seconds, 3600)
+    return f"{int(hours)}h {int(remainder // 60)}m"
+
+
+def _client_rate(key: str):
+    """Build a formatter for a rate field (kbps) shown in Mbps."""
+    def _format(client: dict) -> str:
+        rate = client.get(key, 0)
+        return f"{rate / 1000:.0f} Mbps" if rate else ""
+    return _format
+
+
+# Display field -> formatter taking the raw client dict
+CLIENT_FIELDS = {
+    "name": lambda c: c.get("name") or c.get("hostname") or "(unknown)",
+    "mac": lambda c: c.get("mac", "").upper(),
+    "ip": lambda c: c.get("ip", ""),
+    "network": lambda c: c.get("network", c.get("essid", "")),
+    "type": lambda c: "Wired" if c.get("is_wired", False) else "Wireless",
+    "oui": lambda c: c.get("oui", ""),
+    "signal": _client_signal,
+    "satisfaction": _client_satisfaction,
+    "tx_rate": _client_rate("tx_rate"),
+    "rx_rate": _client_rate("rx_rate"),
+    "uptime": _client_uptime,
+}
+
+
+def format_client(client: dict, keys: list[str] | None = None) -> dict:
+    """Format raw client data for display.
+
+    Only the requested keys are formatted; all fields are returned by default.
+    """
+    return {key: CLIENT_FIELDS[key](client) for key in keys or CLIENT_FIELDS}
 
 
-def handle_error(e: Exception) -> None:
-    """Handle and display API errors."""
-    if isinstance(e, LocalAuthenticationError):
-        console.print(f"[red]Authentication error:[/red] {e.message}")
-    elif isinstance(e, LocalConnectionError):
-        console.print(f"[red]Connection error:[/red] {e.message}")
-    elif isinstance(e, LocalAPIError):
-        console.print(f"[red]API error:[/red] {e.message}")
-    else:
-        console.print(f"[red]Error:[/red] {e}")
-    raise typer.Exit(1)
+def column_keys(columns: list[tuple[str, str]]) -> list[str]:
+    """Get the field keys for a column definition list."""
+    return [key for key, _ in columns]
 
 
 def is_mac_address(value: str) -> bool:
     """Check if a string looks like a MAC address."""
-    # MAC formats: AA:BB:CC:DD:EE:FF or AA-BB-CC-DD-EE-FF or AABBCCDDEEFF
-    import re
-    mac_patterns = [
-        r'^([0-9A-Fa-f]{2}:){5}[0-9A-Fa-f]{2}$',  # AA:BB:CC:DD:EE:FF
-        r'^([0-9A-Fa-f]{2}-){5}[0-9A-Fa-f]{2}$',  # AA-BB-CC-DD-EE-FF
-        r'^[0-9A-Fa-f]{12}$',                       # AABBCCDDEEFF
-    ]
-    return any(re.match(pattern, value) for pattern in mac_patterns)
+    return _MAC_RE.fullmatch(value) is not None
 
 
 async def resolve_client_identifier(
     api_client: UniFiLocalClient,
     identifier: str,
-) -> tuple[str | None, str | None]:
-    """Resolve a client name or MAC to (mac, name).
+    *,
+    clients_cache: list[dict] | None = None,
+) -> tuple[str | None, str | None, dict | None]:
+    """Resolve a client name or MAC to (mac, name, client_data).
 
-    Returns (mac, name) if found, (None, None) if not found.
-    If identifier is a MAC, returns it directly with the name if found.
+    Returns (mac, name, client_data) if found, (None, None, None) if not found.
+    If identifier is a MAC, returns it directly with the name and data if found.
     If identifier is a name, searches for matching client.
+    If clients_cache (from list_all_clients) is given, no API call is made.
+    Otherwise names are first looked up in the on-disk name cache and
+    confirmed with a single client fetch before falling back to the full list.
     """
     if is_mac_address(identifier):
+        mac = identifier.lower().replace("-", ":")
         # It's a MAC address - try to get the client to find its name
-        client_data = await api_client.get_client(identifier)
+        if clients_cache is not None:
+            client_data = next(
+                (c for c in clients_cache if (c.get("mac") or "").lower() == mac), None
+            )
+        else:
+            client_data = await api_client.get_client(identifier)
         if client_data:
             name = client_data.get("name") or client_data.get("hostname") or identifier
-            return identifier.lower().replace("-", ":"), name
-        return identifier.lower().replace("-", ":"), None
+            return mac, name, client_data
+        return mac, None, None
 
-    # It's a name - search for it in all clients
-    clients = await api_client.list_all_clients()
     identifier_lower = identifier.lower()
 
-    for client in clients:
-        name = client.get("name") or client.get("hostname") or ""
-        if name.lower() == identifier_lower:
-            return client.get("mac", "").lower(), name
-
-    # Try partial match if exact match not found
+    # It's a name - search for it in all clients
+    if clients_cache is not None:
+        clients = clients_cache
+    else:
+        name_cache = ClientNameCache(api_client.controller_url)
+        cached_mac = name_cache.get(identifier_lower)
+        if cached_mac:
+            try:
+                client_data = await api_client.get_client(cached_mac)
+            except LocalAPIError:
+                client_data = None
+            if client_data:
+                name = client_data.get("name") or client_data.get("hostname") or ""
+                if name.lower() == identifier_lower:
+                    return cached_mac, name, client_data
+            name_cache.discard(identifier_lower)
+        clients = await api_client.list_all_clients()
+        name_cache.refresh(clients)
+
+    # Exact match wins immediately; partial matches are collected as a fallback
     matches = []
     for client in clients:
         name = client.get("name") or client.get("hostname") or ""
-        if identifier_lower in name.lower():
-            matches.append((client.get("mac", "").lower(), name))
+        name_lower = name.lower()
+        if name_lower == identifier_lower:
+            return client.get("mac", "").lower(), name, client
+        if identifier_lower in name_lower:
+            matches.append((client.get("mac", "").lower(), name, client))
 
     if len(matches) == 1:
         return matches[0]
     elif len(matches) > 1:
         console.print(f"[yellow]Multiple clients match '{identifier}':[/yellow]")
-        for mac, name in matches:
+        for mac, name, _ in matches:
             console.print(f"  - {name} ({mac.upper()})")
-        return None, None
+        return None, None, None
 
-    return None, None
+    return None, None, None
 
 
 @app.command("list")
+@handle_local_errors
 def list_clients(
     output: Annotated[
         OutputFormat,
@@ -194,17 +221,17 @@ def list_clients(
         str | None,
         typer.Option("--group", "-g", help="Filter by client group"),
     ] = None,
+    raw: Annotated[
+        bool,
+        typer.Option("--raw", help="With -o json, output controller records unformatted"),
+    ] = False,
 ) -> None:
     """List active (connected) clients."""
     async def _list():
         client = UniFiLocalClient()
         return await client.list_clients()
 
-    try:
-        clients = run_with_spinner(_list(), "Fetching clients...")
-    except Exception as e:
-        handle_error(e)
-        return
+    clients = run_with_spinner(_list(), "Fetching clients...")
 
     # Apply group filter
     if group:
@@ -223,36 +250,47 @@ def list_clients(
             # Auto group - evaluate rules
             clients = gm.evaluate_auto_group(group, clients)
 
-    # Apply other filters
-    if wired:
-        clients = [c for c in clients if c.get("is_wired", False)]
-    elif wireless:
-        clients = [c for c in clients if not c.get("is_wired", False)]
+    columns = CLIENT_COLUMNS_VERBOSE if verbose else CLIENT_COLUMNS
 
-    if network:
-        network_lower = network.lower()
-        clients = [
-            c
-            for c in clients
-            if network_lower in (c.get("network", "") or c.get("essid", "")).lower()
-        ]
+    # Apply other filters and format in a single pass
+    # JSON keeps every field, table/CSV only the shown columns
+    keys = None if output == OutputFormat.JSON else column_keys(columns)
+    wired_only = wired
+    wireless_only = wireless and not wired
+    network_lower = network.lower() if network else None
+    filtered = (
+        c
+        for c in clients
+        if (not wired_only or c.get("is_wired", False))
+        and (not wireless_only or not c.get("is_wired", False))
+        and (
+            network_lower is None
+            or network_lower in (c.get("network", "") or c.get("essid", "")).lower()
+        )
+    )
+
+    # Raw JSON mirrors the controller's schema, so skip formatting entirely
+    if output == OutputFormat.JSON and raw:
+        output_json_stream(filtered, verbose=verbose)
+        return
 
-    # Format for output
-    formatted = [format_client(c, verbose=verbose) for c in clients]
-
-    columns = CLIENT_COLUMNS_VERBOSE if verbose else CLIENT_COLUMNS
+    formatted = (format_client(c, keys) for c in filtered)
 
     title = f"Clients in '{group}'" if group else "Connected Clients"
 
     if output == OutputFormat.JSON:
-        output_json(formatted, verbose=verbose)
-    elif output == OutputFormat.CSV:
+        output_json_stream(formatted, verbose=verbose)
+        return
+
+    formatted = list(formatted)
+    if output == OutputFormat.CSV:
         output_csv(formatted, columns)
     else:
         output_table(formatted, columns, title=title)
 
 
 @app.command("all")
+@handle_local_errors
 def list_all_clients(
     output: Annotated[
         OutputFormat,
@@ -262,32 +300,37 @@ def list_all_clients(
         bool,
         typer.Option("--verbose", "-v", help="Show additional details"),
     ] = False,
+    raw: Annotated[
+        bool,
+        typer.Option("--raw", help="With -o json, output controller records unformatted"),
+    ] = False,
 ) -> None:
     """List all known clients (including offline)."""
     async def _list():
         client = UniFiLocalClient()
         return await client.list_all_clients()
 
-    try:
-        clients = run_with_spinner(_list(), "Fetching all clients...")
-    except Exception as e:
-        handle_error(e)
-        return
-
-    # Format for output
-    formatted = [format_client(c, verbose=verbose) for c in clients]
+    clients = run_with_spinner(_list(), "Fetching all clients...")
 
     columns = CLIENT_COLUMNS_VERBOSE if verbose else CLIENT_COLUMNS
 
+    # Format for output - JSON keeps every field, table/CSV only the shown columns
+    keys = None if output == OutputFormat.JSON else column_keys(columns)
     if output == OutputFormat.JSON:
-        output_json(formatted, verbose=verbose)
-    elif output == OutputFormat.CSV:
+        # Raw JSON mirrors the controller's schema, so skip formatting entirely
+        items = clients if raw else (format_client(c, keys) for c in clients)
+        output_json_stream(items, verbose=verbose)
+        return
+
+    formatted = [format_client(c, keys) for c in clients]
+    if output == OutputFormat.CSV:
         output_csv(formatted, columns)
     else:
         output_table(formatted, columns, title="All Known Clients")
 
 
 @app.command("get")
+@handle_local_errors
 def get_client(
     identifier: Annotated[
         str | None,
@@ -313,17 +356,11 @@ def get_client(
         raise typer.Exit(1)
     async def _get():
         api_client = UniFiLocalClient()
-        mac, name = await resolve_client_identifier(api_client, identifier)
-        if not mac:
-            return None, None
-        client_data = await api_client.get_client(mac)
+        # Resolution already fetched the full client record
+        _, name, client_data = await resolve_client_identifier(api_client, identifier)
         return client_data, name
 
-    try:
-        client_data, resolved_name = run_with_spinner(_get(), "Finding client...")
-    except Exception as e:
-        handle_error(e)
-        return
+    client_data, resolved_name = run_with_spinner(_get(), "Finding client...")
 
     if not client_data:
         console.print(f"[yellow]Client not found:[/yellow] {identifier}")
@@ -333,15 +370,12 @@ def get_client(
         output_json(client_data)
     else:
         # Display as key-value pairs
-        formatted = format_client(client_data, verbose=True)
+        formatted = format_client(client_data)
         display_name = resolved_name or formatted.get("name", identifier)
-        console.print()
-        console.print(f"[bold]Client Details: {display_name}[/bold]")
-        console.print("─" * 40)
-        for key, value in formatted.items():
-            if value:
-                console.print(f"  [dim]{key}:[/dim] {value}")
-        console.print()
+        lines = ["", f"[bold]Client Details: {display_name}[/bold]", "─" * 40]
+        lines.extend(f"  [dim]{key}:[/dim] {value}" for key, value in formatted.items() if value)
+        lines.append("")
+        console.print("\n".join(lines))
 
 
 def format_bytes(bytes_val: int) -> str:
@@ -374,6 +408,7 @@ def format_uptime(seconds: int) -> str:
 
 
 @app.command("status")
+@handle_local_errors
 def client_status(
     identifier: Annotated[
         str | None,
@@ -399,32 +434,26 @@ def client_status(
         raise typer.Exit(1)
 
     async def _get_status():
-        api_client = UniFiLocalClient()
-        mac, name = await resolve_client_identifier(api_client, identifier)
+        async with UniFiLocalClient() as api_client:
+            # Authenticate once so the concurrent fetches share the session
+            await api_client.ensure_authenticated()
+            # All clients (includes offline) for block status, active clients for live data
+            all_clients, active_clients = await asyncio.gather(
+                api_client.list_all_clients(),
+                api_client.list_clients(),
+            )
+        # Resolution returns the matching record from all_clients
+        mac, name, client_info = await resolve_client_identifier(
+            api_client, identifier, clients_cache=all_clients
+        )
         if not mac:
             return None, None, None, None
-        # Get from all clients (includes offline) for block status
-        all_clients = await api_client.list_all_clients()
-        client_info = None
-        for c in all_clients:
-            if c.get("mac", "").lower() == mac.lower():
-                client_info = c
-                break
-        # Also check active clients for online status and live data
-        active_clients = await api_client.list_clients()
-        active_info = None
-        for c in active_clients:
-            if c.get("mac", "").lower() == mac.lower():
-                active_info = c
-                break
+        active_by_mac = {(c.get("mac") or "").lower(): c for c in active_clients}
+        active_info = active_by_mac.get(mac)
         is_online = active_info is not None
         return client_info, active_info, name, is_online
 
-    try:
-        client_info, active_info, resolved_name, is_online = run_with_spinner(_get_status(), "Checking status...")
-    except Exception as e:
-        handle_error(e)
-        return
+    client_info, active_info, resolved_name, is_online = run_with_spinner(_get_status(), "Checking status...")
 
     if not client_info:
         console.print(f"[yellow]Client not found:[/yellow] {identifier}")
@@ -493,82 +522,88 @@ def client_status(
 
     if output == OutputFormat.JSON:
         output_json(status_data)
+        return
+
+    # Build the report and print it in a single write
+    lines = [
+        "",
+        f"[bold]Client Status: {name}[/bold]",
+        "─" * 40,
+        f"  [dim]MAC:[/dim]       {mac}",
+    ]
+    if vendor:
+        lines.append(f"  [dim]Vendor:[/dim]    {vendor}")
+    if ip:
+        lines.append(f"  [dim]IP:[/dim]        {ip}")
+    lines.append(f"  [dim]Type:[/dim]      {conn_type}")
+    if network:
+        lines.append(f"  [dim]Network:[/dim]   {network}")
+    if ap_name and not is_wired:
+        lines.append(f"  [dim]AP:[/dim]        {ap_name}")
+
+    # Wireless info section
+    if not is_wired and is_online:
+        lines.append("")
+        lines.append("  [bold]WiFi Info[/bold]")
+        if signal is not None:
+            # Color code signal strength
+            if signal >= -50:
+                sig_color = "green"
+            elif signal >= -70:
+                sig_color = "yellow"
+            else:
+                sig_color = "red"
+            lines.append(f"  [dim]Signal:[/dim]    [{sig_color}]{signal} dBm[/{sig_color}]")
+        if channel:
+            channel_info = f"Ch {channel}"
+            if radio:
+                channel_info += f" ({radio.upper()})"
+            lines.append(f"  [dim]Channel:[/dim]   {channel_info}")
+        if satisfaction is not None:
+            # Color code experience
+            if satisfaction >= 80:
+                exp_color = "green"
+            elif satisfaction >= 50:
+                exp_color = "yellow"
+            else:
+                exp_color = "red"
+            lines.append(f"  [dim]Experience:[/dim] [{exp_color}]{satisfaction}%[/{exp_color}]")
+
+    # Connection info section (when online)
+    if is_online:
+        lines.append("")
+        lines.append("  [bold]Connection[/bold]")
+        if uptime:
+            lines.append(f"  [dim]Uptime:[/dim]    {format_uptime(uptime)}")
+        if tx_rate or rx_rate:
+            tx_str = f"{tx_rate / 1000:.0f}" if tx_rate else "0"
+            rx_str = f"{rx_rate / 1000:.0f}" if rx_rate else "0"
+            lines.append(f"  [dim]Speed:[/dim]     ↑{tx_str} / ↓{rx_str} Mbps")
+        if tx_bytes or rx_bytes:
+            lines.append(f"  [dim]Data:[/dim]      ↑{format_bytes(tx_bytes)} / ↓{format_bytes(rx_bytes)}")
+
+    # Status section
+    lines.append("")
+    lines.append("  [bold]Status[/bold]")
+    if is_online:
+        lines.append("  [dim]Online:[/dim]    [green]Yes[/green]")
     else:
-        console.print()
-        console.print(f"[bold]Client Status: {name}[/bold]")
-        console.print("─" * 40)
-        console.print(f"  [dim]MAC:[/dim]       {mac}")
-        if vendor:
-            console.print(f"  [dim]Vendor:[/dim]    {vendor}")
-        if ip:
-            console.print(f"  [dim]IP:[/dim]        {ip}")
-        console.print(f"  [dim]Type:[/dim]      {conn_type}")
-        if network:
-            console.print(f"  [dim]Network:[/dim]   {network}")
-        if ap_name and not is_wired:
-            console.print(f"  [dim]AP:[/dim]        {ap_name}")
-
-        # Wireless info section
-        if not is_wired and is_online:
-            console.print()
-            console.print("  [bold]WiFi Info[/bold]")
-            if signal is not None:
-                # Color code signal strength
-                if signal >= -50:
-                    sig_color = "green"
-                elif signal >= -70:
-                    sig_color = "yellow"
-                else:
-                    sig_color = "red"
-                console.print(f"  [dim]Signal:[/dim]    [{sig_color}]{signal} dBm[/{sig_color}]")
-            if channel:
-                channel_info = f"Ch {channel}"
-                if radio:
-                    channel_info += f" ({radio.upper()})"
-                console.print(f"  [dim]Channel:[/dim]   {channel_info}")
-            if satisfaction is not None:
-                # Color code experience
-                if satisfaction >= 80:
-                    exp_color = "green"
-                elif satisfaction >= 50:
-                    exp_color = "yellow"
-                else:
-                    exp_color = "red"
-                console.print(f"  [dim]Experience:[/dim] [{exp_color}]{satisfaction}%[/{exp_color}]")
-
-        # Connection info section (when online)
-        if is_online:
-            console.print()
-            console.print("  [bold]Connection[/bold]")
-            if uptime:
-                console.print(f"  [dim]Uptime:[/dim]    {format_uptime(uptime)}")
-            if tx_rate or rx_rate:
-                tx_str = f"{tx_rate / 1000:.0f}" if tx_rate else "0"
-                rx_str = f"{rx_rate / 1000:.0f}" if rx_rate else "0"
-                console.print(f"  [dim]Speed:[/dim]     ↑{tx_str} / ↓{rx_str} Mbps")
-            if tx_bytes or rx_bytes:
-                console.print(f"  [dim]Data:[/dim]      ↑{format_bytes(tx_bytes)} / ↓{format_bytes(rx_bytes)}")
-
-        # Status section
-        console.print()
-        console.print("  [bold]Status[/bold]")
-        if is_online:
-            console.print(f"  [dim]Online:[/dim]    [green]Yes[/green]")
-        else:
-            console.print(f"  [dim]Online:[/dim]    [dim]No[/dim]")
+        lines.append("  [dim]Online:[/dim]    [dim]No[/dim]")
 
-        if is_blocked:
-            console.print(f"  [dim]Blocked:[/dim]   [red]Yes[/red]")
-        else:
-            console.print(f"  [dim]Blocked:[/dim]   [green]No[/green]")
+    if is_blocked:
+        lines.append("  [dim]Blocked:[/dim]   [red]Yes[/red]")
+    else:
+        lines.append("  [dim]Blocked:[/dim]   [green]No[/green]")
 
-        if is_guest:
-            console.print(f"  [dim]Guest:[/dim]     Yes")
+    if is_guest:
+        lines.append("  [dim]Guest:[/dim]     Yes")
 
-        console.print()
+    lines.append("")
+    console.print("\n".join(lines))
 
 
 @app.command("block")
+@handle_local_errors
 def block_client(
     identifier: Annotated[
         str | None,
@@ -612,39 +647,30 @@ def block_client(
         _block_group(group, yes, output)
         return
 
-    # Resolve identifier to MAC
-    async def _resolve():
-        api_client = UniFiLocalClient()
-        return await resolve_client_identifier(api_client, identifier)
-
+    # Resolve and block on one connection, confirming in between
+    api_client = UniFiLocalClient(keep_alive=True)
     try:
-        mac, name = run_with_spinner(_resolve(), "Finding client...")
-    except Exception as e:
-        handle_error(e)
-        return
-
-    if not mac:
-        console.print(f"[yellow]Client not found:[/yellow] {identifier}")
-        raise typer.Exit(1)
+        # Resolve identifier to MAC
+        mac, name, _ = run_with_spinner(
+            resolve_client_identifier(api_client, identifier), "Finding client..."
+        )
 
-    display = f"{name} ({mac.upper()})" if name else mac.upper()
+        if not mac:
+            console.print(f"[yellow]Client not found:[/yellow] {identifier}")
+            raise typer.Exit(1)
 
-    # Confirm action
-    if not yes:
-        if not typer.confirm(f"Block client {display}?"):
-            console.print("[dim]Cancelled[/dim]")
-            raise typer.Exit(0)
+        display = f"{name} ({mac.upper()})" if name else mac.upper()
 
-    # Execute action
-    async def _block():
-        api_client = UniFiLocalClient()
-        return await api_client.block_client(mac)
+        # Confirm action
+        if not yes:
+            if not typer.confirm(f"Block client {display}?"):
+                console.print("[dim]Cancelled[/dim]")
+                raise typer.Exit(0)
 
-    try:
-        success = run_with_spinner(_block(), "Blocking client...")
-    except Exception as e:
-        handle_error(e)
-        return
+        # Execute action
+        success = run_with_spinner(api_client.block_client(mac), "Blocking client...")
+    finally:
+        run_sync(api_client.close())
 
     if success:
         if output == OutputFormat.JSON:
@@ -685,11 +711,7 @@ def _block_group(group: str, yes: bool, output: OutputFormat) -> None:
             members = [{"mac": c["mac"], "name": c.get("name") or c.get("hostname")} for c in matching]
             return members, api_client
 
-    try:
-        members, api_client = run_with_spinner(_get_members(), "Getting group members...")
-    except Exception as e:
-        handle_error(e)
-        return
+    members, api_client = run_with_spinner(_get_members(), "Getting group members...")
 
     if not members:
         console.print(f"[yellow]No members in group '{grp.name}'[/yellow]")
@@ -707,43 +729,43 @@ def _block_group(group: str, yes: bool, output: OutputFormat) -> None:
     results = {"blocked": 0, "already": 0, "failed": 0}
     result_details = []
 
-    async def _block_one(mac: str):
-        return await api_client.block_client(mac)
-
-    for member in members:
-        mac = member["mac"]
-        name = member["name"] or mac
-        display = f"{name} ({mac.upper()})" if name != mac else mac.upper()
-
-        try:
-            # Check current status first
-            async def _check():
-                all_clients = await api_client.list_all_clients()
-                for c in all_clients:
-                    if c.get("mac", "").upper() == mac.upper():
-                        return c.get("blocked", False)
-                return False
-
-            is_blocked = asyncio.run(_check())
-
-            if is_blocked:
-                console.print(f"[dim]- {display} - already blocked[/dim]")
-                results["already"] += 1
-                result_details.append({"mac": mac, "name": name, "status": "already_blocked"})
-            else:
-                success = asyncio.run(_block_one(mac))
-                if success:
-                    console.print(f"[green]✓[/green] {display} - blocked")
-                    results["blocked"] += 1
-                    result_details.append({"mac": mac, "name": name, "status": "blocked"})
-                else:
+    async def _block_members():
+        # One connection for every status check and block call
+        async with api_client:
+            blocked_macs = None
+            for member in members:
+                mac = member["mac"]
+                name = member["name"] or mac
+                display = f"{name} ({mac.upper()})" if name != mac else mac.upper()
+
+                try:
+                    # Check current status first (fetched once for the whole group)
+                    if blocked_macs is None:
+                        all_clients = await api_client.list_all_clients()
+                        blocked_macs = {
+                            c.get("mac", "").upper() for c in all_clients if c.get("blocked", False)
+                        }
+
+                    if mac.upper() in blocked_macs:
+                        console.print(f"[dim]- {display} - already blocked[/dim]")
+                        results["already"] += 1
+                        result_details.append({"mac": mac, "name": name, "status": "already_blocked"})
+                    else:
+                        success = await api_client.block_client(mac)
+                        if success:
+                            console.print(f"[green]✓[/green] {display} - blocked")
+                            results["blocked"] += 1
+                            result_details.append({"mac": mac, "name": name, "status": "blocked"})
+                        else:
+                            console.print(f"[red]✗[/red] {display} - failed")
+                            results["failed"] += 1
+                            result_details.append({"mac": mac, "name": name, "status": "failed"})
+                except Exception:
                     console.print(f"[red]✗[/red] {display} - failed")
                     results["failed"] += 1
                     result_details.append({"mac": mac, "name": name, "status": "failed"})
-        except Exception:
-            console.print(f"[red]✗[/red] {display} - failed")
-            results["failed"] += 1
-            result_details.append({"mac": mac, "name": name, "status": "failed"})
+
+    run_sync(_block_members())
 
     console.print(f"\nBlocked: {results['blocked']} | Already blocked: {results['already']} | Failed: {results['failed']}")
 
@@ -752,6 +774,7 @@ def _block_group(group: str, yes: bool, output: OutputFormat) -> None:
 
 
 @app.command("unblock")
+@handle_local_errors
 def unblock_client(
     identifier: Annotated[
         str | None,
@@ -795,39 +818,30 @@ def unblock_client(
         _unblock_group(group, yes, output)
         return
 
-    # Resolve identifier to MAC
-    async def _resolve():
-        api_client = UniFiLocalClient()
-        return await resolve_client_identifier(api_client, identifier)
-
+    # Resolve and unblock on one connection, confirming in between
+    api_client = UniFiLocalClient(keep_alive=True)
     try:
-        mac, name = run_with_spinner(_resolve(), "Finding client...")
-    except Exception as e:
-        handle_error(e)
-        return
-
-    if not mac:
-        console.print(f"[yellow]Client not found:[/yellow] {identifier}")
-        raise typer.Exit(1)
+        # Resolve identifier to MAC
+        mac, name, _ = run_with_spinner(
+            resolve_client_identifier(api_client, identifier), "Finding client..."
+        )
 
-    display = f"{name} ({mac.upper()})" if name else mac.upper()
+        if not mac:
+            console.print(f"[yellow]Client not found:[/yellow] {identifier}")
+            raise typer.Exit(1)
 
-    # Confirm action
-    if not yes:
-        if not typer.confirm(f"Unblock client {display}?"):
-            console.print("[dim]Cancelled[/dim]")
-            raise typer.Exit(0)
+        display = f"{name} ({mac.upper()})" if name else mac.upper()
 
-    # Execute action
-    async def _unblock():
-        api_client = UniFiLocalClient()
-        return await api_client.unblock_client(mac)
+        # Confirm action
+        if not yes:
+            if not typer.confirm(f"Unblock client {display}?"):
+                console.print("[dim]Cancelled[/dim]")
+                raise typer.Exit(0)
 
-    try:
-        success = run_with_spinner(_unblock(), "Unblocking client...")
-    except Exception as e:
-        handle_error(e)
-        return
+        # Execute action
+        success = run_with_spinner(api_client.unblock_client(mac), "Unblocking client...")
+    finally:
+        run_sync(api_client.close())
 
     if success:
         if output == OutputFormat.JSON:
@@ -867,11 +881,7 @@ def _unblock_group(group: str, yes: bool, output: OutputFormat) -> None:
             members = [{"mac": c["mac"], "name": c.get("name") or c.get("hostname")} for c in matching]
             return members, api_client
 
-    try:
-        members, api_client = run_with_spinner(_get_members(), "Getting group members...")
-    except Exception as e:
-        handle_error(e)
-        return
+    members, api_client = run_with_spinner(_get_members(), "Getting group members...")
 
     if not members:
         console.print(f"[yellow]No members in group '{grp.name}'[/yellow]")
@@ -887,42 +897,43 @@ def _unblock_group(group: str, yes: bool, output: OutputFormat) -> None:
     results = {"unblocked": 0, "not_blocked": 0, "failed": 0}
     result_details = []
 
-    for member in members:
-        mac = member["mac"]
-        name = member["name"] or mac
-        display = f"{name} ({mac.upper()})" if name != mac else mac.upper()
-
-        try:
-            async def _check():
-                all_clients = await api_client.list_all_clients()
-                for c in all_clients:
-                    if c.get("mac", "").upper() == mac.upper():
-                        return c.get("blocked", False)
-                return False
-
-            is_blocked = asyncio.run(_check())
-
-            if not is_blocked:
-                console.print(f"[dim]- {display} - not blocked[/dim]")
-                results["not_blocked"] += 1
-                result_details.append({"mac": mac, "name": name, "status": "not_blocked"})
-            else:
-                async def _unblock_one():
-                    return await api_client.unblock_client(mac)
-
-                success = asyncio.run(_unblock_one())
-                if success:
-                    console.print(f"[green]✓[/green] {display} - unblocked")
-                    results["unblocked"] += 1
-                    result_details.append({"mac": mac, "name": name, "status": "unblocked"})
-                else:
+    async def _unblock_members():
+        # One connection for every status check and unblock call
+        async with api_client:
+            blocked_macs = None
+            for member in members:
+                mac = member["mac"]
+                name = member["name"] or mac
+                display = f"{name} ({mac.upper()})" if name != mac else mac.upper()
+
+                try:
+                    # Check current status first (fetched once for the whole group)
+                    if blocked_macs is None:
+                        all_clients = await api_client.list_all_clients()
+                        blocked_macs = {
+                            c.get("mac", "").upper() for c in all_clients if c.get("blocked", False)
+                        }
+
+                    if mac.upper() not in blocked_macs:
+                        console.print(f"[dim]- {display} - not blocked[/dim]")
+                        results["not_blocked"] += 1
+                        result_details.append({"mac": mac, "name": name, "status": "not_blocked"})
+                    else:
+                        success = await api_client.unblock_client(mac)
+                        if success:
+                            console.print(f"[green]✓[/green] {display} - unblocked")
+                            results["unblocked"] += 1
+                            result_details.append({"mac": mac, "name": name, "status": "unblocked"})
+                        else:
+                            console.print(f"[red]✗[/red] {display} - failed")
+                            results["failed"] += 1
+                            result_details.append({"mac": mac, "name": name, "status": "failed"})
+                except Exception:
                     console.print(f"[red]✗[/red] {display} - failed")
                     results["failed"] += 1
                     result_details.append({"mac": mac, "name": name, "status": "failed"})
-        except Exception:
-            console.print(f"[red]✗[/red] {display} - failed")
-            results["failed"] += 1
-            result_details.append({"mac": mac, "name": name, "status": "failed"})
+
+    run_sync(_unblock_members())
 
     console.print(f"\nUnblocked: {results['unblocked']} | Not blocked: {results['not_blocked']} | Failed: {results['failed']}")
 
@@ -931,6 +942,7 @@ def _unblock_group(group: str, yes: bool, output: OutputFormat) -> None:
 
 
 @app.command("kick")
+@handle_local_errors
 def kick_client(
     identifier: Annotated[
         str | None,
@@ -974,39 +986,30 @@ def kick_client(
         _kick_group(group, yes, output)
         return
 
-    # Resolve identifier to MAC
-    async def _resolve():
-        api_client = UniFiLocalClient()
-        return await resolve_client_identifier(api_client, identifier)
-
+    # Resolve and kick on one connection, confirming in between
+    api_client = UniFiLocalClient(keep_alive=True)
     try:
-        mac, name = run_with_spinner(_resolve(), "Finding client...")
-    except Exception as e:
-        handle_error(e)
-        return
+        # Resolve identifier to MAC
+        mac, name, _ = run_with_spinner(
+            resolve_client_identifier(api_client, identifier), "Finding client..."
+        )
 
-    if not mac:
-        console.print(f"[yellow]Client not found:[/yellow] {identifier}")
-        raise typer.Exit(1)
+        if not mac:
+            console.print(f"[yellow]Client not found:[/yellow] {identifier}")
+            raise typer.Exit(1)
 
-    display = f"{name} ({mac.upper()})" if name else mac.upper()
+        display = f"{name} ({mac.upper()})" if name else mac.upper()
 
-    # Confirm action
-    if not yes:
-        if not typer.confirm(f"Kick client {display}?"):
-            console.print("[dim]Cancelled[/dim]")
-            raise typer.Exit(0)
-
-    # Execute action
-    async def _kick():
-        api_client = UniFiLocalClient()
-        return await api_client.kick_client(mac)
+        # Confirm action
+        if not yes:
+            if not typer.confirm(f"Kick client {display}?"):
+                console.print("[dim]Cancelled[/dim]")
+                raise typer.Exit(0)
 
-    try:
-        success = run_with_spinner(_kick(), "Kicking client...")
-    except Exception as e:
-        handle_error(e)
-        return
+        # Execute action
+        success = run_with_spinner(api_client.kick_client(mac), "Kicking client...")
+    finally:
+        run_sync(api_client.close())
 
     if success:
         if output == OutputFormat.JSON:
@@ -1046,11 +1049,7 @@ def _kick_group(group: str, yes: bool, output: OutputFormat) -> None:
             members = [{"mac": c["mac"], "name": c.get("name") or c.get("hostname")} for c in matching]
             return members, api_client
 
-    try:
-        members, api_client = run_with_spinner(_get_members(), "Getting group members...")
-    except Exception as e:
-        handle_error(e)
-        return
+    members, api_client = run_with_spinner(_get_members(), "Getting group members...")
 
     if not members:
         console.print(f"[yellow]No members in group '{grp.name}'[/yellow]")
@@ -1066,28 +1065,30 @@ def _kick_group(group: str, yes: bool, output: OutputFormat) -> None:
     results = {"kicked": 0, "failed": 0}
     result_details = []
 
-    for member in members:
-        mac = member["mac"]
-        name = member["name"] or mac
-        display = f"{name} ({mac.upper()})" if name != mac else mac.upper()
-
-        try:
-            async def _kick_one():
-                return await api_client.kick_client(mac)
+    async def _kick_members():
+        # One connection for every kick call
+        async with api_client:
+            for member in members:
+                mac = member["mac"]
+                name = member["name"] or mac
+                display = f"{name} ({mac.upper()})" if name != mac else mac.upper()
+
+                try:
+                    success = await api_client.kick_client(mac)
+                    if success:
+                        console.print(f"[green]✓[/green] {display} - kicked")
+                        results["kicked"] += 1
+                        result_details.append({"mac": mac, "name": name, "status": "kicked"})
+                    else:
+                        console.print(f"[red]✗[/red] {display} - failed")
+                        results["failed"] += 1
+                        result_details.append({"mac": mac, "name": name, "status": "failed"})
+                except Exception:
+                    console.print(f"[red]✗[/red] {display} - failed")
+                    results["failed"] += 1
+                    result_details.append({"mac": mac, "name": name, "status": "failed"})
 
-            success = asyncio.run(_kick_one())
-            if success:
-                console.print(f"[green]✓[/green] {display} - kicked")
-                results["kicked"] += 1
-                result_details.append({"mac": mac, "name": name, "status": "kicked"})
-            else:
-                console.print(f"[red]✗[/red] {display} - failed")
-                results["failed"] += 1
-                result_details.append({"mac": mac, "name": name, "status": "failed"})
-        except Exception:
-            console.print(f"[red]✗[/red] {display} - failed")
-            results["failed"] += 1
-            result_details.append({"mac": mac, "name": name, "status": "failed"})
+    run_sync(_kick_members())
 
     console.print(f"\nKicked: {results['kicked']} | Failed: {results['failed']}")
 
@@ -1095,7 +1096,7 @@ def _kick_group(group: str, yes: bool, output: OutputFormat) -> None:
         output_json({"group": grp.name, "results": result_details, "summary": results})
 
 
-class CountBy(str, typer.Typer):
+class CountBy(str, Enum):
     """Grouping options for count command."""
 
     TYPE = "type"
@@ -1105,27 +1106,56 @@ class CountBy(str, typer.Typer):
     EXPERIENCE = "experience"
 
 
+# Experience score thresholds and the category label for each band
+EXPERIENCE_THRESHOLDS = (50, 80)
+EXPERIENCE_LABELS = ("Poor (<50%)", "Fair (50-79%)", "Good (80%+)")
+
+
 def get_experience_category(satisfaction: int | None) -> str:
     """Categorize experience score."""
     if satisfaction is None:
         return "Unknown"
-    if satisfaction >= 80:
-        return "Good (80%+)"
-    if satisfaction >= 50:
-        return "Fair (50-79%)"
-    return "Poor (<50%)"
+    return EXPERIENCE_LABELS[bisect.bisect_right(EXPERIENCE_THRESHOLDS, satisfaction)]
+
+
+def _count_key_ap(client: dict) -> str:
+    """Get AP name - wireless clients have ap_mac and last_uplink_name."""
+    if client.get("is_wired", False):
+        return "(wired)"
+    return client.get("last_uplink_name") or client.get("ap_mac", "(unknown)")
+
+
+# Grouping -> function extracting the group key from a raw client
+COUNT_KEYS = {
+    CountBy.TYPE: lambda c: "Wired" if c.get("is_wired", False) else "Wireless",
+    CountBy.NETWORK: lambda c: c.get("network") or c.get("essid") or "(none)",
+    CountBy.VENDOR: lambda c: c.get("oui") or "(unknown)",
+    CountBy.AP: _count_key_ap,
+    CountBy.EXPERIENCE: lambda c: get_experience_category(c.get("satisfaction")),
+}
+
+# Grouping -> (table title, group column header)
+COUNT_TITLES = {
+    CountBy.TYPE: ("Client Count by Type", "Type"),
+    CountBy.NETWORK: ("Client Count by Network", "Network"),
+    CountBy.VENDOR: ("Client Count by Vendor", "Vendor"),
+    CountBy.AP: ("Client Count by Access Point", "Access Point"),
+    CountBy.EXPERIENCE: ("Client Count by Experience", "Experience"),
+}
 
 
 @app.command("count")
+@handle_local_errors
 def count_clients(
     by: Annotated[
-        str,
+        CountBy,
         typer.Option(
             "--by",
             "-b",
             help="Group by: type, network, vendor, ap, experience",
+            case_sensitive=False,
         ),
-    ] = "type",
+    ] = CountBy.TYPE,
     include_offline: Annotated[
         bool,
         typer.Option(
@@ -1147,51 +1177,14 @@ def count_clients(
         else:
             return await api_client.list_clients()
 
-    try:
-        clients = run_with_spinner(_count(), "Counting clients...")
-    except Exception as e:
-        handle_error(e)
-        return
+    clients = run_with_spinner(_count(), "Counting clients...")
 
     # Count by the specified grouping
-    counts: dict[str, int] = {}
-    by_lower = by.lower()
-
-    for client in clients:
-        if by_lower == "type":
-            key = "Wired" if client.get("is_wired", False) else "Wireless"
-        elif by_lower == "network":
-            key = client.get("network") or client.get("essid") or "(none)"
-        elif by_lower == "vendor":
-            key = client.get("oui") or "(unknown)"
-        elif by_lower == "ap":
-            # Get AP name - wireless clients have ap_mac and last_uplink_name
-            if client.get("is_wired", False):
-                key = "(wired)"
-            else:
-                key = client.get("last_uplink_name") or client.get("ap_mac", "(unknown)")
-        elif by_lower == "experience":
-            satisfaction = client.get("satisfaction")
-            key = get_experience_category(satisfaction)
-        else:
-            console.print(f"[red]Invalid grouping:[/red] {by}")
-            console.print("Valid options: type, network, vendor, ap, experience")
-            raise typer.Exit(1)
-
-        counts[key] = counts.get(key, 0) + 1
-
-    # Determine title and headers based on grouping
-    titles = {
-        "type": ("Client Count by Type", "Type"),
-        "network": ("Client Count by Network", "Network"),
-        "vendor": ("Client Count by Vendor", "Vendor"),
-        "ap": ("Client Count by Access Point", "Access Point"),
-        "experience": ("Client Count by Experience", "Experience"),
-    }
-    title, group_header = titles.get(by_lower, ("Client Count", "Group"))
+    counts = Counter(COUNT_KEYS[by](client) for client in clients)
+    title, group_header = COUNT_TITLES[by]
 
     if output == OutputFormat.JSON:
-        output_json({"counts": counts, "total": sum(counts.values())})
+        output_json({"counts": dict(counts), "total": sum(counts.values())})
     elif output == OutputFormat.CSV:
         # Output as CSV
         rows = [{"group": k, "count": v} for k, v in sorted(counts.items())]
@@ -1202,6 +1195,7 @@ def count_clients(
 
 
 @app.command("duplicates")
+@handle_local_errors
 def find_duplicates(
     output: Annotated[
         OutputFormat,
@@ -1221,11 +1215,7 @@ def find_duplicates(
         api_client = UniFiLocalClient()
         return await api_client.list_all_clients()
 
-    try:
-        clients = run_with_spinner(_list(), "Finding duplicates...")
-    except Exception as e:
-        handle_error(e)
-        return
+    clients = run_with_spinner(_list(), "Finding duplicates...")
 
     # Group clients by name
     by_name: dict[str, list[dict]] = {}
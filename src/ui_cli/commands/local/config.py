@@ -1,18 +1,17 @@
 """Running configuration commands for local controller."""
 
 import asyncio
+import re
+from collections import defaultdict
 from datetime import datetime, timezone
 from enum import Enum
+from functools import lru_cache
 from typing import Annotated
 
 import typer
 
-from ui_cli.local_client import (
-    LocalAPIError,
-    LocalAuthenticationError,
-    LocalConnectionError,
-    UniFiLocalClient,
-)
+from ui_cli.commands.local.utils import handle_local_errors, run_with_spinner
+from ui_cli.local_client import UniFiLocalClient
 from ui_cli.output import OutputFormat, console, output_json
 
 app = typer.Typer(help="View running configuration")
@@ -30,19 +29,58 @@ class ConfigSection(str, Enum):
     ROUTING = "routing"
 
 
-def handle_error(e: Exception) -> None:
-    """Handle and display API errors."""
-    if isinstance(e, LocalAuthenticationError):
-        console.print(f"[red]Authentication error:[/red] {e.message}")
-    elif isinstance(e, LocalConnectionError):
-        console.print(f"[red]Connection error:[/red] {e.message}")
-    elif isinstance(e, LocalAPIError):
-        console.print(f"[red]API error:[/red] {e.message}")
-    else:
-        console.print(f"[red]Error:[/red] {e}")
-    raise typer.Exit(1)
+# Config keys whose values are hidden unless --show-secrets is given
+_SECRET_RE = re.compile(r"password|secret|x_passphrase|wpa_psk", re.IGNORECASE)
+
+# Exported string values that look like secrets themselves
+_SECRET_VALUE_RE = re.compile(r"\b(?:password|secret|x_passphrase|wpa_psk)\b", re.IGNORECASE)
+
+# Display order of firewall rulesets; unknown rulesets sort last
+_RULESET_RANK = {
+    name: i
+    for i, name in enumerate(
+        ["WAN_IN", "WAN_OUT", "WAN_LOCAL", "LAN_IN", "LAN_OUT", "LAN_LOCAL", "GUEST_IN", "GUEST_OUT"]
+    )
+}
+
+# Display order and labels of device types
+_DEVICE_TYPE_RANK = {"ugw": 0, "udm": 0, "usw": 1, "uap": 2, "uph": 3}
+_DEVICE_TYPE_LABELS = {"ugw": "Gateway", "udm": "Gateway", "usw": "Switch", "uap": "AP", "uph": "Phone"}
+
+# Firewall actions colored by effect; others show plain
+_FIREWALL_ACTION_LABELS = {
+    "ACCEPT": "[green]ACCEPT[/green]",
+    "DROP": "[red]DROP[/red]",
+    "REJECT": "[red]REJECT[/red]",
+}
+
+_FIREWALL_GROUP_TYPES = {"address-group": "Address", "port-group": "Port", "network-group": "Network"}
+
+# WLAN security and band labels; unknown security modes show as-is
+_SECURITY_LABELS = {"wpaeap": "WPA Enterprise", "open": "Open"}
+_WPA_PSK_LABELS = {"wpa2": "WPA2 Personal"}
+_BAND_LABELS = {"2g": "2.4 GHz only", "5g": "5 GHz only"}
+
+# AP radio band labels
+_RADIO_BANDS = {"ng": "2.4G", "na": "5G"}
+
+
+def redact_secrets(config: dict | list) -> None:
+    """Replace secret values in a config tree with asterisks, in place."""
+    stack = [config]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, dict):
+            for k, v in obj.items():
+                if _SECRET_RE.search(k):
+                    obj[k] = "********"
+                elif isinstance(v, (dict, list)):
+                    stack.append(v)
+        else:
+            stack.extend(v for v in obj if isinstance(v, (dict, list)))
 
 
+@lru_cache(maxsize=1024)
 def format_uptime(seconds: int) -> str:
     """Format uptime seconds to human-readable string."""
     if seconds < 60:
@@ -64,78 +102,85 @@ def format_uptime(seconds: int) -> str:
 # Formatting Functions for Each Section
 # ============================================================
 
+def _name_key(item: dict) -> str:
+    """Sort key for config items by name."""
+    return item.get("name") or ""
+
+
 def format_networks_section(networks: list[dict], verbose: bool = False) -> None:
     """Format and print networks section."""
     if not networks:
         console.print("  [dim](no networks configured)[/dim]")
         return
 
+    lines: list[str] = []
     for net in sorted(networks, key=lambda x: x.get("vlan_enabled", False) and x.get("vlan", 0) or 0):
-        name = net.get("name", "Unnamed")
-        purpose = net.get("purpose", "unknown")
+        get = net.get
+        name = get("name", "Unnamed")
+        purpose = get("purpose", "unknown")
 
         # VLAN info
-        vlan = net.get("vlan", "")
-        vlan_str = f" (VLAN {vlan})" if net.get("vlan_enabled") and vlan else ""
+        vlan = get("vlan", "")
+        vlan_str = f" (VLAN {vlan})" if get("vlan_enabled") and vlan else ""
 
-        console.print(f"  [bold]{name}[/bold]{vlan_str}")
-        console.print(f"    [dim]Purpose:[/dim]       {purpose}")
+        lines.append(f"  [bold]{name}[/bold]{vlan_str}")
+        lines.append(f"    [dim]Purpose:[/dim]       {purpose}")
 
         # Subnet info
-        subnet = net.get("ip_subnet", "")
+        subnet = get("ip_subnet", "")
         if subnet:
-            console.print(f"    [dim]Subnet:[/dim]        {subnet}")
+            lines.append(f"    [dim]Subnet:[/dim]        {subnet}")
 
         # Gateway
-        gateway = net.get("ipv4_gateway", "") or net.get("gateway", "")
+        gateway = get("ipv4_gateway", "") or get("gateway", "")
         if not gateway and subnet:
             # Derive gateway from subnet (usually .1)
-            parts = subnet.split("/")
-            if parts:
-                ip_parts = parts[0].split(".")
-                if len(ip_parts) == 4:
-                    gateway = f"{ip_parts[0]}.{ip_parts[1]}.{ip_parts[2]}.1"
+            base = subnet.partition("/")[0]
+            if base.count(".") == 3:
+                gateway = base.rpartition(".")[0] + ".1"
         if gateway:
-            console.print(f"    [dim]Gateway:[/dim]       {gateway}")
+            lines.append(f"    [dim]Gateway:[/dim]       {gateway}")
 
         # DHCP
-        dhcp_enabled = net.get("dhcpd_enabled", False)
+        dhcp_enabled = get("dhcpd_enabled", False)
         if dhcp_enabled:
-            dhcp_start = net.get("dhcpd_start", "")
-            dhcp_stop = net.get("dhcpd_stop", "")
+            dhcp_start = get("dhcpd_start", "")
+            dhcp_stop = get("dhcpd_stop", "")
             if dhcp_start and dhcp_stop:
-                console.print(f"    [dim]DHCP:[/dim]          Enabled ({dhcp_start} - {dhcp_stop})")
+                lines.append(f"    [dim]DHCP:[/dim]          Enabled ({dhcp_start} - {dhcp_stop})")
             else:
-                console.print(f"    [dim]DHCP:[/dim]          Enabled")
+                lines.append(f"    [dim]DHCP:[/dim]          Enabled")
         else:
-            console.print(f"    [dim]DHCP:[/dim]          Disabled")
+            lines.append(f"    [dim]DHCP:[/dim]          Disabled")
 
         # DNS
-        dns1 = net.get("dhcpd_dns_1", "")
-        dns2 = net.get("dhcpd_dns_2", "")
-        if dns1 or dns2:
-            dns_list = [d for d in [dns1, dns2] if d]
-            console.print(f"    [dim]DNS:[/dim]           {', '.join(dns_list)}")
+        dns1 = get("dhcpd_dns_1", "")
+        dns2 = get("dhcpd_dns_2", "")
+        dns_str = ", ".join(filter(None, (dns1, dns2)))
+        if dns_str:
+            lines.append(f"    [dim]DNS:[/dim]           {dns_str}")
 
         # Domain
-        domain = net.get("domain_name", "")
+        domain = get("domain_name", "")
         if domain:
-            console.print(f"    [dim]Domain:[/dim]        {domain}")
+            lines.append(f"    [dim]Domain:[/dim]        {domain}")
 
         # Isolation
-        if net.get("network_isolation", False):
-            console.print(f"    [dim]Isolation:[/dim]     [yellow]Yes[/yellow]")
+        if get("network_isolation", False):
+            lines.append(f"    [dim]Isolation:[/dim]     [yellow]Yes[/yellow]")
 
         # Internet access
-        if net.get("internet_access_enabled") is False:
-            console.print(f"    [dim]Internet:[/dim]      [red]Blocked[/red]")
+        if get("internet_access_enabled") is False:
+            lines.append(f"    [dim]Internet:[/dim]      [red]Blocked[/red]")
 
         if verbose:
-            net_id = net.get("_id", "")
+            net_id = get("_id", "")
             if net_id:
-                console.print(f"    [dim]ID:[/dim]            {net_id}")
+                lines.append(f"    [dim]ID:[/dim]            {net_id}")
 
-        console.print()
+        lines.append("")
+
+    console.print("\n".join(lines))
 
 
 def format_wireless_section(wlans: list[dict], networks: list[dict], verbose: bool = False) -> None:
@@ -147,75 +192,64 @@ def format_wireless_section(wlans: list[dict], networks: list[dict], verbose: bo
     # Build network ID to name mapping
     net_map = {n.get("_id"): n.get("name", "Unknown") for n in networks}
 
-    for wlan in sorted(wlans, key=lambda x: x.get("name", "")):
-        name = wlan.get("name", "Unnamed")
-        enabled = wlan.get("enabled", True)
+    lines: list[str] = []
+    for wlan in sorted(wlans, key=_name_key):
+        get = wlan.get
+        name = get("name", "Unnamed")
+        enabled = get("enabled", True)
 
         status = "" if enabled else " [red](disabled)[/red]"
-        console.print(f"  [bold]{name}[/bold]{status}")
+        lines.append(f"  [bold]{name}[/bold]{status}")
 
         # Network mapping
-        network_id = wlan.get("networkconf_id", "")
+        network_id = get("networkconf_id", "")
         network_name = net_map.get(network_id, "Default")
-        console.print(f"    [dim]Network:[/dim]       {network_name}")
+        lines.append(f"    [dim]Network:[/dim]       {network_name}")
 
         # Security
-        security = wlan.get("security", "open")
-        wpa_mode = wlan.get("wpa_mode", "")
-        wpa3 = wlan.get("wpa3_support", False)
+        security = get("security", "open")
+        wpa_mode = get("wpa_mode", "")
+        wpa3 = get("wpa3_support", False)
 
         if security == "wpapsk":
-            if wpa3:
-                sec_str = "WPA2/WPA3 Personal"
-            elif wpa_mode == "wpa2":
-                sec_str = "WPA2 Personal"
-            else:
-                sec_str = "WPA Personal"
-        elif security == "wpaeap":
-            sec_str = "WPA Enterprise"
-        elif security == "open":
-            sec_str = "Open"
+            sec_str = "WPA2/WPA3 Personal" if wpa3 else _WPA_PSK_LABELS.get(wpa_mode, "WPA Personal")
         else:
-            sec_str = security
-        console.print(f"    [dim]Security:[/dim]      {sec_str}")
+            sec_str = _SECURITY_LABELS.get(security, security)
+        lines.append(f"    [dim]Security:[/dim]      {sec_str}")
 
         # Bands
-        wlan_band = wlan.get("wlan_band", "both")
-        if wlan_band == "2g":
-            band_str = "2.4 GHz only"
-        elif wlan_band == "5g":
-            band_str = "5 GHz only"
-        else:
-            band_str = "2.4 GHz + 5 GHz"
-        console.print(f"    [dim]Band:[/dim]          {band_str}")
+        band_str = _BAND_LABELS.get(get("wlan_band", "both"), "2.4 GHz + 5 GHz")
+        lines.append(f"    [dim]Band:[/dim]          {band_str}")
 
         # Hidden SSID
-        if wlan.get("hide_ssid", False):
-            console.print(f"    [dim]Hidden:[/dim]        Yes")
+        if get("hide_ssid", False):
+            lines.append(f"    [dim]Hidden:[/dim]        Yes")
 
         # Guest network
-        if wlan.get("is_guest", False):
-            console.print(f"    [dim]Guest:[/dim]         Yes")
+        if get("is_guest", False):
+            lines.append(f"    [dim]Guest:[/dim]         Yes")
 
         # Client isolation
-        if wlan.get("ap_group_isolation", False) or wlan.get("l2_isolation", False):
-            console.print(f"    [dim]Isolation:[/dim]     Yes")
+        if get("ap_group_isolation", False) or get("l2_isolation", False):
+            lines.append(f"    [dim]Isolation:[/dim]     Yes")
 
         # Fast roaming
-        if wlan.get("fast_roaming_enabled", False):
-            console.print(f"    [dim]Fast Roaming:[/dim] Yes")
+        if get("fast_roaming_enabled", False):
+            lines.append(f"    [dim]Fast Roaming:[/dim] Yes")
 
         # PMF
-        pmf = wlan.get("pmf_mode", "")
+        pmf = get("pmf_mode", "")
         if pmf:
-            console.print(f"    [dim]PMF:[/dim]           {pmf}")
+            lines.append(f"    [dim]PMF:[/dim]           {pmf}")
 
         if verbose:
-            wlan_id = wlan.get("_id", "")
+            wlan_id = get("_id", "")
             if wlan_id:
-                console.print(f"    [dim]ID:[/dim]            {wlan_id}")
+                lines.append(f"    [dim]ID:[/dim]            {wlan_id}")
 
-        console.print()
+        lines.append("")
+
+    console.print("\n".join(lines))
 
 
 def format_firewall_section(rules: list[dict], groups: list[dict], verbose: bool = False) -> None:
@@ -224,72 +258,75 @@ def format_firewall_section(rules: list[dict], groups: list[dict], verbose: bool
     group_map = {g.get("_id"): g.get("name", "Unknown") for g in groups}
 
     # Group rules by ruleset
-    rulesets: dict[str, list] = {}
+    rulesets: dict[str, list] = defaultdict(list)
     for rule in rules:
-        ruleset = rule.get("ruleset", "unknown")
-        if ruleset not in rulesets:
-            rulesets[ruleset] = []
-        rulesets[ruleset].append(rule)
+        rulesets[rule.get("ruleset", "unknown")].append(rule)
 
     # Sort rulesets in logical order
-    ruleset_order = ["WAN_IN", "WAN_OUT", "WAN_LOCAL", "LAN_IN", "LAN_OUT", "LAN_LOCAL", "GUEST_IN", "GUEST_OUT"]
-    sorted_rulesets = sorted(rulesets.keys(), key=lambda x: ruleset_order.index(x) if x in ruleset_order else 99)
+    sorted_rulesets = sorted(rulesets, key=lambda x: _RULESET_RANK.get(x, 99))
 
+    lines: list[str] = []
     if not rules:
-        console.print("  [dim](no custom firewall rules)[/dim]")
+        lines.append("  [dim](no custom firewall rules)[/dim]")
     else:
         for ruleset in sorted_rulesets:
             ruleset_rules = sorted(rulesets[ruleset], key=lambda x: x.get("rule_index", 0))
-            console.print(f"  [bold]{ruleset}[/bold] ({len(ruleset_rules)} rules)")
+            lines.append(f"  [bold]{ruleset}[/bold] ({len(ruleset_rules)} rules)")
 
             for rule in ruleset_rules:
-                idx = rule.get("rule_index", "")
-                name = rule.get("name", "Unnamed")
-                action = rule.get("action", "").upper()
-                enabled = rule.get("enabled", True)
+                get = rule.get
+                idx = get("rule_index", "")
+                name = get("name", "Unnamed")
+                action = get("action", "").upper()
+                enabled = get("enabled", True)
 
                 # Color code action
-                if action == "DROP" or action == "REJECT":
-                    action_str = f"[red]{action}[/red]"
-                elif action == "ACCEPT":
-                    action_str = f"[green]{action}[/green]"
-                else:
-                    action_str = action
+                action_str = _FIREWALL_ACTION_LABELS.get(action, action)
 
                 status = "" if enabled else " [dim](disabled)[/dim]"
 
                 # Source/destination
-                src = rule.get("src_firewallgroup_ids", [])
-                dst = rule.get("dst_firewallgroup_ids", [])
+                src = get("src_firewallgroup_ids", [])
+                dst = get("dst_firewallgroup_ids", [])
                 src_str = ", ".join([group_map.get(s, s) for s in src]) if src else "Any"
                 dst_str = ", ".join([group_map.get(d, d) for d in dst]) if dst else "Any"
 
                 # Protocol/port
-                protocol = rule.get("protocol", "all")
-                dst_port = rule.get("dst_port", "")
+                protocol = get("protocol", "all")
+                dst_port = get("dst_port", "")
                 proto_str = protocol.upper()
                 if dst_port:
                     proto_str += f" {dst_port}"
 
-                console.print(f"    {idx:4} {name[:25]:<25} {action_str:<8} {src_str[:12]:<12} → {dst_str[:12]:<12} {proto_str}{status}")
+                lines.append(f"    {idx:4} {name[:25]:<25} {action_str:<8} {src_str[:12]:<12} → {dst_str[:12]:<12} {proto_str}{status}")
 
-            console.print()
+            lines.append("")
 
     # Firewall groups
     if groups:
-        console.print(f"  [bold]Firewall Groups[/bold] ({len(groups)} groups)")
-        for group in sorted(groups, key=lambda x: x.get("name", "")):
-            name = group.get("name", "Unnamed")
-            group_type = group.get("group_type", "unknown")
-            members = group.get("group_members", [])
-
-            type_str = {"address-group": "Address", "port-group": "Port", "network-group": "Network"}.get(group_type, group_type)
+        lines.append(f"  [bold]Firewall Groups[/bold] ({len(groups)} groups)")
+        for group in sorted(groups, key=_name_key):
+            get = group.get
+            name = get("name", "Unnamed")
+            group_type = get("group_type", "unknown")
+            members = get("group_members", [])
+
+            type_str = _FIREWALL_GROUP_TYPES.get(group_type, group_type)
             members_str = ", ".join(members[:5])
             if len(members) > 5:
                 members_str += f" (+{len(members) - 5} more)"
 
-            console.print(f"    {name:<20} [{type_str}] {members_str}")
-        console.print()
+            lines.append(f"    {name:<20} [{type_str}] {members_str}")
+        lines.append("")
+
+    console.print("\n".join(lines))
+
+
+# Port forwarding table column header and rule lines
+_PORT_FORWARDS_HEADER = (
+    f"  {'Name':<20} {'Protocol':<10} {'WAN Port':<12} {'LAN IP':<16} {'LAN Port':<10} {'Enabled'}",
+    f"  {'-' * 20} {'-' * 10} {'-' * 12} {'-' * 16} {'-' * 10} {'-' * 7}",
+)
 
 
 def format_port_forwards_section(forwards: list[dict], verbose: bool = False) -> None:
@@ -298,22 +335,23 @@ def format_port_forwards_section(forwards: list[dict], verbose: bool = False) ->
         console.print("  [dim](no port forwards configured)[/dim]")
         return
 
-    console.print(f"  {'Name':<20} {'Protocol':<10} {'WAN Port':<12} {'LAN IP':<16} {'LAN Port':<10} {'Enabled'}")
-    console.print(f"  {'-' * 20} {'-' * 10} {'-' * 12} {'-' * 16} {'-' * 10} {'-' * 7}")
+    lines = list(_PORT_FORWARDS_HEADER)
 
-    for fwd in sorted(forwards, key=lambda x: x.get("name", "")):
-        name = fwd.get("name", "Unnamed")[:20]
-        proto = fwd.get("proto", "tcp_udp").upper()
-        dst_port = fwd.get("dst_port", "")
-        fwd_ip = fwd.get("fwd", "")
-        fwd_port = fwd.get("fwd_port", dst_port)
-        enabled = fwd.get("enabled", True)
+    for fwd in sorted(forwards, key=_name_key):
+        get = fwd.get
+        name = get("name", "Unnamed")[:20]
+        proto = get("proto", "tcp_udp").upper()
+        dst_port = get("dst_port", "")
+        fwd_ip = get("fwd", "")
+        fwd_port = get("fwd_port", dst_port)
+        enabled = get("enabled", True)
 
         enabled_str = "[green]Yes[/green]" if enabled else "[red]No[/red]"
 
-        console.print(f"  {name:<20} {proto:<10} {dst_port:<12} {fwd_ip:<16} {fwd_port:<10} {enabled_str}")
+        lines.append(f"  {name:<20} {proto:<10} {dst_port:<12} {fwd_ip:<16} {fwd_port:<10} {enabled_str}")
 
-    console.print()
+    lines.append("")
+    console.print("\n".join(lines))
 
 
 def format_devices_section(devices: list[dict], verbose: bool = False) -> None:
@@ -323,22 +361,22 @@ def format_devices_section(devices: list[dict], verbose: bool = False) -> None:
         return
 
     # Sort by type then name
-    type_order = {"ugw": 0, "udm": 0, "usw": 1, "uap": 2, "uph": 3}
-    sorted_devices = sorted(devices, key=lambda x: (type_order.get(x.get("type", ""), 99), x.get("name", "")))
+    sorted_devices = sorted(devices, key=lambda x: (_DEVICE_TYPE_RANK.get(x.get("type", ""), 99), x.get("name", "")))
 
+    lines: list[str] = []
     for dev in sorted_devices:
-        name = dev.get("name", "Unnamed")
-        model = dev.get("model", "Unknown")
-        dev_type = dev.get("type", "")
-        ip = dev.get("ip", "")
-        mac = dev.get("mac", "").upper()
-        version = dev.get("version", "")
-        state = dev.get("state", 0)
-        uptime = dev.get("uptime", 0)
+        get = dev.get
+        name = get("name", "Unnamed")
+        model = get("model", "Unknown")
+        dev_type = get("type", "")
+        ip = get("ip", "")
+        mac = get("mac", "").upper()
+        version = get("version", "")
+        state = get("state", 0)
+        uptime = get("uptime", 0)
 
         # Device type label
-        type_labels = {"ugw": "Gateway", "udm": "Gateway", "usw": "Switch", "uap": "AP", "uph": "Phone"}
-        type_label = type_labels.get(dev_type, dev_type.upper())
+        type_label = _DEVICE_TYPE_LABELS.get(dev_type, dev_type.upper())
 
         # State
         state_str = ""
@@ -349,48 +387,52 @@ def format_devices_section(devices: list[dict], verbose: bool = False) -> None:
         else:
             state_str = f"[yellow]state:{state}[/yellow]"
 
-        console.print(f"  [bold]{name}[/bold] ({model}) {state_str}")
-        console.print(f"    [dim]Type:[/dim]          {type_label}")
-        console.print(f"    [dim]IP:[/dim]            {ip}")
-        console.print(f"    [dim]MAC:[/dim]           {mac}")
+        lines.append(f"  [bold]{name}[/bold] ({model}) {state_str}")
+        lines.append(f"    [dim]Type:[/dim]          {type_label}")
+        lines.append(f"    [dim]IP:[/dim]            {ip}")
+        lines.append(f"    [dim]MAC:[/dim]           {mac}")
         if version:
-            console.print(f"    [dim]Firmware:[/dim]      {version}")
+            lines.append(f"    [dim]Firmware:[/dim]      {version}")
         if uptime:
-            console.print(f"    [dim]Uptime:[/dim]        {format_uptime(uptime)}")
+            lines.append(f"    [dim]Uptime:[/dim]        {format_uptime(uptime)}")
 
         # AP-specific: radio info
         if dev_type == "uap":
-            radio_table = dev.get("radio_table", [])
+            radio_table = get("radio_table", [])
             for radio in radio_table:
                 radio_type = radio.get("radio", "")
                 channel = radio.get("channel", "")
                 ht = radio.get("ht", "")
                 tx_power = radio.get("tx_power", "")
 
-                if radio_type == "ng":
-                    band = "2.4G"
-                elif radio_type == "na":
-                    band = "5G"
-                else:
-                    band = radio_type
+                band = _RADIO_BANDS.get(radio_type, radio_type)
 
                 ht_str = f" ({ht})" if ht else ""
                 power_str = f", {tx_power}dBm" if tx_power else ""
-                console.print(f"    [dim]Channel {band}:[/dim]   {channel}{ht_str}{power_str}")
+                lines.append(f"    [dim]Channel {band}:[/dim]   {channel}{ht_str}{power_str}")
 
         # Switch-specific: port info
         if dev_type == "usw" and verbose:
-            port_table = dev.get("port_table", [])
+            port_table = get("port_table", [])
             if port_table:
                 up_ports = [p for p in port_table if p.get("up", False)]
-                console.print(f"    [dim]Ports:[/dim]         {len(up_ports)}/{len(port_table)} up")
+                lines.append(f"    [dim]Ports:[/dim]         {len(up_ports)}/{len(port_table)} up")
 
         if verbose:
-            dev_id = dev.get("_id", "")
+            dev_id = get("_id", "")
             if dev_id:
-                console.print(f"    [dim]ID:[/dim]            {dev_id}")
+                lines.append(f"    [dim]ID:[/dim]            {dev_id}")
+
+        lines.append("")
+
+    console.print("\n".join(lines))
 
-        console.print()
+
+# DHCP reservations table column header and rule lines
+_DHCP_RESERVATIONS_HEADER = (
+    f"  {'Name':<20} {'MAC':<18} {'IP':<16} {'Network'}",
+    f"  {'-' * 20} {'-' * 18} {'-' * 16} {'-' * 15}",
+)
 
 
 def format_dhcp_reservations_section(reservations: list[dict], networks: list[dict], verbose: bool = False) -> None:
@@ -402,19 +444,27 @@ def format_dhcp_reservations_section(reservations: list[dict], networks: list[di
     # Build network ID to name mapping
     net_map = {n.get("_id"): n.get("name", "Unknown") for n in networks}
 
-    console.print(f"  {'Name':<20} {'MAC':<18} {'IP':<16} {'Network'}")
-    console.print(f"  {'-' * 20} {'-' * 18} {'-' * 16} {'-' * 15}")
+    lines = list(_DHCP_RESERVATIONS_HEADER)
 
     for res in sorted(reservations, key=lambda x: x.get("name", "") or x.get("hostname", "")):
-        name = (res.get("name") or res.get("hostname") or "Unknown")[:20]
-        mac = res.get("mac", "").upper()
-        ip = res.get("fixed_ip", "")
-        network_id = res.get("network_id", "")
+        get = res.get
+        name = (get("name") or get("hostname") or "Unknown")[:20]
+        mac = get("mac", "").upper()
+        ip = get("fixed_ip", "")
+        network_id = get("network_id", "")
         network_name = net_map.get(network_id, "Default")
 
-        console.print(f"  {name:<20} {mac:<18} {ip:<16} {network_name}")
+        lines.append(f"  {name:<20} {mac:<18} {ip:<16} {network_name}")
+
+    lines.append("")
+    console.print("\n".join(lines))
+
 
-    console.print()
+# Static routes table column header and rule lines
+_ROUTING_HEADER = (
+    f"  {'Name':<20} {'Destination':<20} {'Gateway/Interface':<20} {'Enabled'}",
+    f"  {'-' * 20} {'-' * 20} {'-' * 20} {'-' * 7}",
+)
 
 
 def format_routing_section(routes: list[dict], verbose: bool = False) -> None:
@@ -423,159 +473,195 @@ def format_routing_section(routes: list[dict], verbose: bool = False) -> None:
         console.print("  [dim](no static routes configured)[/dim]")
         return
 
-    console.print(f"  {'Name':<20} {'Destination':<20} {'Gateway/Interface':<20} {'Enabled'}")
-    console.print(f"  {'-' * 20} {'-' * 20} {'-' * 20} {'-' * 7}")
+    lines = list(_ROUTING_HEADER)
 
-    for route in sorted(routes, key=lambda x: x.get("name", "")):
-        name = route.get("name", "Unnamed")[:20]
-        dest = route.get("static_route_network", "")
-        gateway = route.get("static_route_nexthop", "") or route.get("static_route_interface", "")
-        enabled = route.get("enabled", True)
+    for route in sorted(routes, key=_name_key):
+        get = route.get
+        name = get("name", "Unnamed")[:20]
+        dest = get("static_route_network", "")
+        gateway = get("static_route_nexthop", "") or get("static_route_interface", "")
+        enabled = get("enabled", True)
 
         enabled_str = "[green]Yes[/green]" if enabled else "[red]No[/red]"
 
-        console.print(f"  {name:<20} {dest:<20} {gateway:<20} {enabled_str}")
+        lines.append(f"  {name:<20} {dest:<20} {gateway:<20} {enabled_str}")
 
-    console.print()
+    lines.append("")
+    console.print("\n".join(lines))
 
 
-def to_yaml(config: dict, hide_secrets: bool = True) -> str:
-    """Convert config to YAML format."""
-    lines = []
-    lines.append("# UniFi Running Configuration")
-    lines.append(f"# Exported: {datetime.now(timezone.utc).isoformat()}")
-    lines.append("")
+def _yaml_null(v, hide_secrets: bool) -> str:
+    """Write None as YAML null."""
+    return "null"
 
-    def yaml_value(v, indent=0):
-        """Convert a value to YAML string."""
-        prefix = "  " * indent
-        if v is None:
-            return "null"
-        elif isinstance(v, bool):
-            return "true" if v else "false"
-        elif isinstance(v, (int, float)):
-            return str(v)
-        elif isinstance(v, str):
-            # Hide passwords/secrets
-            if hide_secrets and any(s in v.lower() for s in ["password", "secret", "key", "x_passphrase"]):
-                return '"********"'
-            if "\n" in v or ":" in v or '"' in v:
-                return f'"{v}"'
-            return v if v else '""'
-        elif isinstance(v, list):
-            if not v:
-                return "[]"
-            if all(isinstance(i, (str, int, float, bool)) for i in v):
-                return "[" + ", ".join(yaml_value(i) for i in v) + "]"
-            return v  # Complex list, handle separately
-        elif isinstance(v, dict):
-            return v  # Handle separately
-        return str(v)
-
-    def write_dict(d, indent=0):
-        """Write a dict as YAML."""
-        prefix = "  " * indent
-        for k, v in d.items():
-            # Skip internal fields
-            if k.startswith("_") and k != "_id":
-                continue
-            # Hide secret fields
-            if hide_secrets and any(s in k.lower() for s in ["password", "secret", "x_passphrase", "wpa_psk"]):
-                lines.append(f"{prefix}{k}: \"********\"")
-                continue
 
-            val = yaml_value(v, indent)
-            if isinstance(val, dict):
-                lines.append(f"{prefix}{k}:")
-                write_dict(val, indent + 1)
-            elif isinstance(val, list) and val and isinstance(val[0], dict):
-                lines.append(f"{prefix}{k}:")
-                for item in val:
-                    lines.append(f"{prefix}  -")
-                    write_dict(item, indent + 2)
-            else:
-                lines.append(f"{prefix}{k}: {val}")
+def _yaml_bool(v: bool, hide_secrets: bool) -> str:
+    """Write a bool as YAML true/false."""
+    return "true" if v else "false"
+
+
+def _yaml_plain(v, hide_secrets: bool) -> str:
+    """Write a number (or anything else) with str()."""
+    return str(v)
+
+
+def _yaml_str(v: str, hide_secrets: bool) -> str:
+    """Write a string, quoting or hiding it as needed."""
+    # Hide passwords/secrets
+    if hide_secrets and _SECRET_VALUE_RE.search(v):
+        return '"********"'
+    if "\n" in v or ":" in v or '"' in v:
+        return f'"{v}"'
+    return v if v else '""'
+
+
+def _yaml_list(v: list, hide_secrets: bool) -> str | list:
+    """Write a list of scalars inline."""
+    if not v:
+        return "[]"
+    if all(type(i) in _YAML_SCALAR_TYPES for i in v):
+        return "[" + ", ".join(_yaml_value(i, hide_secrets) for i in v) + "]"
+    return v  # Complex list, not exported
+
+
+_YAML_SCALAR_TYPES = {str, int, float, bool}
+
+# YAML value formatter by exact type; anything else is written with str()
+_YAML_DISPATCH = {
+    type(None): _yaml_null,
+    bool: _yaml_bool,
+    int: _yaml_plain,
+    float: _yaml_plain,
+    str: _yaml_str,
+    list: _yaml_list,
+}
+
+
+def _yaml_value(v, hide_secrets: bool) -> str | list:
+    """Convert a value to a YAML string (complex lists are returned as-is)."""
+    return _YAML_DISPATCH.get(type(v), _yaml_plain)(v, hide_secrets)
+
+
+def to_yaml(config: dict, hide_secrets: bool = True, timestamp: str | None = None) -> str:
+    """Convert config to YAML format.
+
+    timestamp is the ISO export time for the header, defaulting to now (UTC).
+    """
+    if timestamp is None:
+        timestamp = datetime.now(timezone.utc).isoformat()
+
+    lines = ["# UniFi Running Configuration", f"# Exported: {timestamp}", ""]
+    append = lines.append
 
     # Networks
     if config.get("networks"):
-        lines.append("networks:")
+        append("networks:")
         for net in config["networks"]:
-            lines.append(f"  - name: {net.get('name', 'Unknown')}")
+            append(f"  - name: {net.get('name', 'Unknown')}")
             for k, v in net.items():
-                if k == "name" or k.startswith("_"):
+                # Nested objects are not exported
+                if k == "name" or k.startswith("_") or isinstance(v, dict):
                     continue
-                val = yaml_value(v)
-                if not isinstance(val, (dict, list)) or (isinstance(val, list) and isinstance(val, str)):
-                    lines.append(f"    {k}: {val}")
-        lines.append("")
+                val = _yaml_value(v, hide_secrets)
+                if not isinstance(val, list):
+                    append(f"    {k}: {val}")
+        append("")
 
     # Wireless
     if config.get("wireless"):
-        lines.append("wireless:")
+        append("wireless:")
         for wlan in config["wireless"]:
-            lines.append(f"  - name: {wlan.get('name', 'Unknown')}")
+            append(f"  - name: {wlan.get('name', 'Unknown')}")
             for k, v in wlan.items():
                 if k == "name" or k.startswith("_"):
                     continue
-                if hide_secrets and any(s in k.lower() for s in ["password", "x_passphrase", "wpa_psk"]):
-                    lines.append(f"    {k}: \"********\"")
+                if hide_secrets and _SECRET_RE.search(k):
+                    append(f"    {k}: \"********\"")
                     continue
-                val = yaml_value(v)
-                if not isinstance(val, (dict, list)) or (isinstance(val, list) and isinstance(val, str)):
-                    lines.append(f"    {k}: {val}")
-        lines.append("")
+                # Nested objects are not exported
+                if isinstance(v, dict):
+                    continue
+                val = _yaml_value(v, hide_secrets)
+                if not isinstance(val, list):
+                    append(f"    {k}: {val}")
+        append("")
 
     # Firewall rules
     if config.get("firewall_rules"):
-        lines.append("firewall_rules:")
+        append("firewall_rules:")
         for rule in config["firewall_rules"]:
-            lines.append(f"  - name: {rule.get('name', 'Unknown')}")
-            lines.append(f"    ruleset: {rule.get('ruleset', '')}")
-            lines.append(f"    action: {rule.get('action', '')}")
-            lines.append(f"    enabled: {yaml_value(rule.get('enabled', True))}")
-        lines.append("")
+            append(f"  - name: {rule.get('name', 'Unknown')}")
+            append(f"    ruleset: {rule.get('ruleset', '')}")
+            append(f"    action: {rule.get('action', '')}")
+            append(f"    enabled: {_yaml_value(rule.get('enabled', True), hide_secrets)}")
+        append("")
 
     # Port forwards
     if config.get("port_forwards"):
-        lines.append("port_forwards:")
+        append("port_forwards:")
         for fwd in config["port_forwards"]:
-            lines.append(f"  - name: {fwd.get('name', 'Unknown')}")
-            lines.append(f"    dst_port: {fwd.get('dst_port', '')}")
-            lines.append(f"    fwd: {fwd.get('fwd', '')}")
-            lines.append(f"    fwd_port: {fwd.get('fwd_port', '')}")
-            lines.append(f"    proto: {fwd.get('proto', 'tcp_udp')}")
-            lines.append(f"    enabled: {yaml_value(fwd.get('enabled', True))}")
-        lines.append("")
+            append(f"  - name: {fwd.get('name', 'Unknown')}")
+            append(f"    dst_port: {fwd.get('dst_port', '')}")
+            append(f"    fwd: {fwd.get('fwd', '')}")
+            append(f"    fwd_port: {fwd.get('fwd_port', '')}")
+            append(f"    proto: {fwd.get('proto', 'tcp_udp')}")
+            append(f"    enabled: {_yaml_value(fwd.get('enabled', True), hide_secrets)}")
+        append("")
 
     # DHCP reservations
     if config.get("dhcp_reservations"):
-        lines.append("dhcp_reservations:")
+        append("dhcp_reservations:")
         for res in config["dhcp_reservations"]:
             name = res.get("name") or res.get("hostname") or "Unknown"
-            lines.append(f"  - name: {name}")
-            lines.append(f"    mac: {res.get('mac', '')}")
-            lines.append(f"    fixed_ip: {res.get('fixed_ip', '')}")
-        lines.append("")
+            append(f"  - name: {name}")
+            append(f"    mac: {res.get('mac', '')}")
+            append(f"    fixed_ip: {res.get('fixed_ip', '')}")
+        append("")
 
     # Devices
     if config.get("devices"):
-        lines.append("devices:")
+        append("devices:")
         for dev in config["devices"]:
-            lines.append(f"  - name: {dev.get('name', 'Unknown')}")
-            lines.append(f"    model: {dev.get('model', '')}")
-            lines.append(f"    mac: {dev.get('mac', '').upper()}")
-            lines.append(f"    ip: {dev.get('ip', '')}")
-            lines.append(f"    type: {dev.get('type', '')}")
-        lines.append("")
+            append(f"  - name: {dev.get('name', 'Unknown')}")
+            append(f"    model: {dev.get('model', '')}")
+            append(f"    mac: {dev.get('mac', '').upper()}")
+            append(f"    ip: {dev.get('ip', '')}")
+            append(f"    type: {dev.get('type', '')}")
+        append("")
 
     return "\n".join(lines)
 
 
+# Table output framing
+_CONFIG_TITLE = "[bold]UniFi Running Configuration[/bold]"
+_HEADER_RULE = "═" * 70
+_SECTION_BOTTOM = "└" + "─" * 70 + "┘"
+
+
+def _section_top(title: str) -> str:
+    """Build the top border of a table output section."""
+    return f"┌─ [bold]{title}[/bold] " + "─" * (66 - len(title)) + "┐"
+
+
+# Table output sections in display order:
+# (section, top border, formatter, content config keys, lookup config keys)
+TABLE_SECTIONS = [
+    (ConfigSection.NETWORKS, _section_top("NETWORKS"), format_networks_section, ("networks",), ()),
+    (ConfigSection.WIRELESS, _section_top("WIRELESS"), format_wireless_section, ("wireless",), ("networks",)),
+    (ConfigSection.FIREWALL, _section_top("FIREWALL"), format_firewall_section, ("firewall_rules", "firewall_groups"), ()),
+    (ConfigSection.PORTFWD, _section_top("PORT FORWARDING"), format_port_forwards_section, ("port_forwards",), ()),
+    (ConfigSection.DHCP, _section_top("DHCP RESERVATIONS"), format_dhcp_reservations_section, ("dhcp_reservations",), ("networks",)),
+    (ConfigSection.ROUTING, _section_top("STATIC ROUTES"), format_routing_section, ("routing",), ()),
+    (ConfigSection.DEVICES, _section_top("DEVICES"), format_devices_section, ("devices",), ()),
+]
+
+
 # ============================================================
 # Commands
 # ============================================================
 
 @app.command("show")
+@handle_local_errors
 def show_config(
     section: Annotated[
         ConfigSection,
@@ -607,152 +693,100 @@ def show_config(
         ./ui lo config show -o json            # Export as JSON
         ./ui lo config show --show-secrets     # Include passwords
     """
+    client = UniFiLocalClient()
+
     async def _fetch_config():
-        client = UniFiLocalClient()
-        # Fetch only what we need based on section
-        if section == ConfigSection.ALL:
-            return await client.get_running_config()
-        elif section == ConfigSection.NETWORKS:
-            return {"networks": await client.get_networks()}
-        elif section == ConfigSection.WIRELESS:
-            return {
-                "wireless": await client.get_wlans(),
-                "networks": await client.get_networks(),  # For network name mapping
-            }
-        elif section == ConfigSection.FIREWALL:
-            return {
-                "firewall_rules": await client.get_firewall_rules(),
-                "firewall_groups": await client.get_firewall_groups(),
-            }
-        elif section == ConfigSection.DEVICES:
-            return {"devices": await client.get_devices()}
-        elif section == ConfigSection.PORTFWD:
-            return {"port_forwards": await client.get_port_forwards()}
-        elif section == ConfigSection.DHCP:
-            return {
-                "dhcp_reservations": await client.get_dhcp_reservations(),
-                "networks": await client.get_networks(),
-            }
-        elif section == ConfigSection.ROUTING:
-            return {"routing": await client.get_routing()}
-        return {}
-
-    try:
-        from ui_cli.commands.local.utils import run_with_spinner
-        config = run_with_spinner(_fetch_config(), "Fetching configuration...")
-    except Exception as e:
-        handle_error(e)
-        return
+        # Fetch only what we need based on section, sharing one connection
+        # and fetching concurrently where a section needs more than one list
+        async with client:
+            await client.ensure_authenticated()
+            if section == ConfigSection.ALL:
+                return await client.get_running_config()
+            elif section == ConfigSection.NETWORKS:
+                return {"networks": await client.get_networks()}
+            elif section == ConfigSection.WIRELESS:
+                wlans, networks = await asyncio.gather(
+                    client.get_wlans(),
+                    client.get_networks(),  # For network name mapping
+                )
+                return {"wireless": wlans, "networks": networks}
+            elif section == ConfigSection.FIREWALL:
+                rules, groups = await asyncio.gather(
+                    client.get_firewall_rules(),
+                    client.get_firewall_groups(),
+                )
+                return {"firewall_rules": rules, "firewall_groups": groups}
+            elif section == ConfigSection.DEVICES:
+                return {"devices": await client.get_devices()}
+            elif section == ConfigSection.PORTFWD:
+                return {"port_forwards": await client.get_port_forwards()}
+            elif section == ConfigSection.DHCP:
+                reservations, networks = await asyncio.gather(
+                    client.get_dhcp_reservations(),
+                    client.get_networks(),
+                )
+                return {"dhcp_reservations": reservations, "networks": networks}
+            elif section == ConfigSection.ROUTING:
+                return {"routing": await client.get_routing()}
+            return {}
+
+    config = run_with_spinner(_fetch_config(), "Fetching configuration...")
+    exported_at = datetime.now(timezone.utc)
 
     # Handle different output formats
     if output == OutputFormat.JSON:
         # For JSON, optionally hide secrets
         if hide_secrets:
-            def redact_secrets(obj):
-                if isinstance(obj, dict):
-                    return {
-                        k: "********" if any(s in k.lower() for s in ["password", "secret", "x_passphrase", "wpa_psk"]) else redact_secrets(v)
-                        for k, v in obj.items()
-                    }
-                elif isinstance(obj, list):
-                    return [redact_secrets(i) for i in obj]
-                return obj
-            config = redact_secrets(config)
+            redact_secrets(config)
         output_json(config)
         return
 
     if output.value == "yaml" or str(output) == "yaml":
-        console.print(to_yaml(config, hide_secrets=hide_secrets))
+        console.print(to_yaml(config, hide_secrets=hide_secrets, timestamp=exported_at.isoformat()))
         return
 
     # Table output
     controller_url = client.controller_url
     site = client.site
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-    console.print()
-    console.print("[bold]UniFi Running Configuration[/bold]")
-    console.print("═" * 70)
-    console.print(f"Controller: {controller_url}")
-    console.print(f"Site: {site}")
-    console.print(f"Exported: {timestamp}")
-    console.print("═" * 70)
-    console.print()
-
-    # Networks section
-    if section in (ConfigSection.ALL, ConfigSection.NETWORKS):
-        networks = config.get("networks", [])
-        console.print("┌─ [bold]NETWORKS[/bold] " + "─" * 58 + "┐")
-        console.print()
-        format_networks_section(networks, verbose)
-        console.print("└" + "─" * 70 + "┘")
-        console.print()
-
-    # Wireless section
-    if section in (ConfigSection.ALL, ConfigSection.WIRELESS):
-        wlans = config.get("wireless", [])
-        networks = config.get("networks", [])
-        console.print("┌─ [bold]WIRELESS[/bold] " + "─" * 58 + "┐")
-        console.print()
-        format_wireless_section(wlans, networks, verbose)
-        console.print("└" + "─" * 70 + "┘")
-        console.print()
-
-    # Firewall section
-    if section in (ConfigSection.ALL, ConfigSection.FIREWALL):
-        rules = config.get("firewall_rules", [])
-        groups = config.get("firewall_groups", [])
-        console.print("┌─ [bold]FIREWALL[/bold] " + "─" * 58 + "┐")
-        console.print()
-        format_firewall_section(rules, groups, verbose)
-        console.print("└" + "─" * 70 + "┘")
-        console.print()
-
-    # Port forwarding section
-    if section in (ConfigSection.ALL, ConfigSection.PORTFWD):
-        forwards = config.get("port_forwards", [])
-        console.print("┌─ [bold]PORT FORWARDING[/bold] " + "─" * 51 + "┐")
-        console.print()
-        format_port_forwards_section(forwards, verbose)
-        console.print("└" + "─" * 70 + "┘")
-        console.print()
+    timestamp = exported_at.astimezone().strftime("%Y-%m-%d %H:%M:%S")
 
-    # DHCP reservations section
-    if section in (ConfigSection.ALL, ConfigSection.DHCP):
-        reservations = config.get("dhcp_reservations", [])
-        networks = config.get("networks", [])
-        console.print("┌─ [bold]DHCP RESERVATIONS[/bold] " + "─" * 49 + "┐")
+    # Render everything, then write it to the terminal in one go
+    with console.capture() as capture:
         console.print()
-        format_dhcp_reservations_section(reservations, networks, verbose)
-        console.print("└" + "─" * 70 + "┘")
+        console.print(_CONFIG_TITLE)
+        console.print(_HEADER_RULE)
+        console.print(f"Controller: {controller_url}")
+        console.print(f"Site: {site}")
+        console.print(f"Exported: {timestamp}")
+        console.print(_HEADER_RULE)
         console.print()
 
-    # Routing section
-    if section in (ConfigSection.ALL, ConfigSection.ROUTING):
-        routes = config.get("routing", [])
-        console.print("┌─ [bold]STATIC ROUTES[/bold] " + "─" * 53 + "┐")
-        console.print()
-        format_routing_section(routes, verbose)
-        console.print("└" + "─" * 70 + "┘")
-        console.print()
+        for table_section, top, formatter, content_keys, lookup_keys in TABLE_SECTIONS:
+            if section not in (ConfigSection.ALL, table_section):
+                continue
+            content = [config.get(key, []) for key in content_keys]
+            # The full view leaves out sections with nothing configured
+            if section == ConfigSection.ALL and not any(content):
+                continue
+            lookups = [config.get(key, []) for key in lookup_keys]
 
-    # Devices section
-    if section in (ConfigSection.ALL, ConfigSection.DEVICES):
-        devices = config.get("devices", [])
-        console.print("┌─ [bold]DEVICES[/bold] " + "─" * 59 + "┐")
-        console.print()
-        format_devices_section(devices, verbose)
-        console.print("└" + "─" * 70 + "┘")
-        console.print()
+            console.print(top)
+            console.print()
+            formatter(*content, *lookups, verbose)
+            console.print(_SECTION_BOTTOM)
+            console.print()
 
-    # Summary
-    if section == ConfigSection.ALL:
-        networks_count = len(config.get("networks", []))
-        wlans_count = len(config.get("wireless", []))
-        rules_count = len(config.get("firewall_rules", []))
-        forwards_count = len(config.get("port_forwards", []))
-        devices_count = len(config.get("devices", []))
-        dhcp_count = len(config.get("dhcp_reservations", []))
+        # Summary
+        if section == ConfigSection.ALL:
+            networks_count = len(config.get("networks", []))
+            wlans_count = len(config.get("wireless", []))
+            rules_count = len(config.get("firewall_rules", []))
+            forwards_count = len(config.get("port_forwards", []))
+            devices_count = len(config.get("devices", []))
+            dhcp_count = len(config.get("dhcp_reservations", []))
+
+            console.print(f"[dim]Summary: {networks_count} networks, {wlans_count} SSIDs, {rules_count} firewall rules, {forwards_count} port forwards, {devices_count} devices, {dhcp_count} DHCP reservations[/dim]")
+            console.print()
 
-        console.print(f"[dim]Summary: {networks_count} networks, {wlans_count} SSIDs, {rules_count} firewall rules, {forwards_count} port forwards, {devices_count} devices, {dhcp_count} DHCP reservations[/dim]")
-        console.print()
+    console.file.write(capture.get())
+    console.file.flush()
@@ -0,0 +1,76 @@
+"""Site dashboard command for local controller."""
+
+import asyncio
+from typing import Annotated
+
+import typer
+
+from ui_cli.commands.local.events import get_event_type, print_alarms_table, print_events_table
+from ui_cli.commands.local.health import print_health
+from ui_cli.commands.local.utils import run_with_spinner
+from ui_cli.local_client import LocalAPIError, UniFiLocalClient
+from ui_cli.output import OutputFormat, console, output_json, print_error
+
+app = typer.Typer(
+    name="dashboard",
+    help="Health, active alarms and recent events at a glance",
+    invoke_without_command=True,
+)
+
+
+@app.callback(invoke_without_command=True)
+def dashboard(
+    ctx: typer.Context,
+    limit: Annotated[
+        int,
+        typer.Option("--limit", "-l", help="Number of recent events to show"),
+    ] = 10,
+    output: Annotated[
+        OutputFormat,
+        typer.Option("--output", "-o", help="Output format"),
+    ] = OutputFormat.TABLE,
+    verbose: Annotated[
+        bool,
+        typer.Option("--verbose", "-v", help="Show additional health details"),
+    ] = False,
+) -> None:
+    """Show site health, active alarms and recent events."""
+    if ctx.invoked_subcommand is not None:
+        return
+
+    async def _dashboard():
+        async with UniFiLocalClient() as client:
+            # Log in once so the concurrent requests share the session
+            await client.ensure_authenticated()
+            return await asyncio.gather(
+                client.get_health(),
+                client.get_alarms(),
+                client.get_events(limit=limit),
+            )
+
+    try:
+        health_data, alarms, events = run_with_spinner(_dashboard(), "Loading dashboard...")
+    except LocalAPIError as e:
+        print_error(str(e))
+        raise typer.Exit(1)
+
+    if output == OutputFormat.JSON:
+        output_json({"health": health_data, "alarms": alarms, "events": events})
+        return
+
+    if health_data:
+        print_health(health_data, verbose)
+    else:
+        console.print("[dim]No health data available[/dim]")
+
+    console.print()
+    if alarms:
+        print_alarms_table(alarms)
+    else:
+        console.print("[green]No active alarms[/green]")
+
+    console.print()
+    if events:
+        print_events_table([(e, get_event_type(e)) for e in events])
+    else:
+        console.print("[dim]No events found[/dim]")
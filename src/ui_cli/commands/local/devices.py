@@ -1,11 +1,10 @@
 """Device management commands for local controller."""
 
-import asyncio
 from typing import Annotated, Any
 
 import typer
 
-from ui_cli.commands.local.utils import run_with_spinner
+from ui_cli.commands.local.utils import run_sync, run_with_spinner
 from ui_cli.local_client import LocalAPIError, UniFiLocalClient
 from ui_cli.output import (
     OutputFormat,
@@ -35,8 +34,9 @@ DEVICE_TYPES = {
 
 def get_device_type(device: dict[str, Any]) -> str:
     """Get human-readable device type."""
-    dev_type = device.get("type", "")
-    return DEVICE_TYPES.get(dev_type, dev_type.upper() if dev_type else "Unknown")
+    dev_type = device.get("type") or ""
+    # Only build the fallback label when the type is not a known one
+    return DEVICE_TYPES.get(dev_type) or dev_type.upper() or "Unknown"
 
 
 def get_device_status(device: dict[str, Any]) -> tuple[str, str]:
@@ -64,9 +64,9 @@ def get_uptime(device: dict[str, Any]) -> str:
     if not uptime:
         return "-"
 
-    days = uptime // 86400
-    hours = (uptime % 86400) // 3600
-    minutes = (uptime % 3600) // 60
+    days, rem = divmod(uptime, 86400)
+    hours, rem = divmod(rem, 3600)
+    minutes = rem // 60
 
     if days > 0:
         return f"{days}d {hours}h"
@@ -92,39 +92,63 @@ def format_version(device: dict[str, Any]) -> str:
 
 
 def find_device(devices: list[dict[str, Any]], identifier: str) -> dict[str, Any] | None:
-    """Find device by ID, MAC, name, or IP."""
-    identifier_lower = identifier.lower()
+    """Find device by ID, MAC, name, or IP.
 
-    # First try exact ID match
-    for d in devices:
-        device_id = d.get("_id", "")
-        if device_id == identifier:
-            return d
+    Tries, in order: exact ID, MAC (colon, dash or no separators), exact name,
+    partial name, then IP. The first device in list order wins each step.
+    """
+    identifier_lower = identifier.lower()
 
-    # Try exact MAC match
+    # Index every device in one pass, keeping the first device per key
+    by_id: dict[str, dict[str, Any]] = {}
+    by_mac: dict[str, dict[str, Any]] = {}
+    by_name: dict[str, dict[str, Any]] = {}
+    by_ip: dict[str, dict[str, Any]] = {}
+    names: list[tuple[str, dict[str, Any]]] = []
     for d in devices:
-        mac = d.get("mac", "").lower()
-        if mac == identifier_lower or mac.replace(":", "") == identifier_lower.replace(":", ""):
+        name = (d.get("name") or "").lower()
+        by_id.setdefault(d.get("_id", ""), d)
+        by_mac.setdefault((d.get("mac") or "").lower().replace(":", ""), d)
+        by_name.setdefault(name, d)
+        by_ip.setdefault(d.get("ip", ""), d)
+        names.append((name, d))
+
+    for index, key in (
+        (by_id, identifier),
+        (by_mac, identifier_lower.replace(":", "").replace("-", "")),
+        (by_name, identifier_lower),
+    ):
+        if key in index:
+            return index[key]
+
+    # Partial name match
+    for name, d in names:
+        if identifier_lower in name:
             return d
 
-    # Try name match (exact then partial)
-    for d in devices:
-        name = d.get("name", "").lower()
-        if name == identifier_lower:
-            return d
+    return by_ip.get(identifier)
 
-    for d in devices:
-        name = d.get("name", "").lower()
-        if identifier_lower in name:
-            return d
 
-    # Try IP match
-    for d in devices:
-        ip = d.get("ip", "")
-        if ip == identifier:
-            return d
+def _device_row(d: dict[str, Any], verbose: bool) -> tuple[str, ...]:
+    """Build a device table row, with load and client columns when verbose."""
+    status, status_style = get_device_status(d)
+    row = (
+        d.get("_id", ""),
+        d.get("name", "(unnamed)"),
+        d.get("model", ""),
+        get_device_type(d),
+        d.get("ip", ""),
+        d.get("mac", ""),
+        format_version(d),
+        f"[{status_style}]{status}[/{status_style}]",
+        get_uptime(d),
+    )
+    if not verbose:
+        return row
 
-    return None
+    # Client count varies by device type
+    num_sta = d.get("num_sta", d.get("user-num_sta", 0))
+    return (*row, get_load(d), str(num_sta) if num_sta else "-")
 
 
 @app.command("list")
@@ -216,47 +240,7 @@ def list_devices(
             table.add_column("Clients", justify="right")
 
         for d in devices:
-            device_id = d.get("_id", "")
-            name = d.get("name", "(unnamed)")
-            model = d.get("model", "")
-            dev_type = get_device_type(d)
-            ip = d.get("ip", "")
-            mac = d.get("mac", "")
-            version = format_version(d)
-            status, status_style = get_device_status(d)
-            uptime = get_uptime(d)
-
-            if verbose:
-                load = get_load(d)
-                # Client count varies by device type
-                num_sta = d.get("num_sta", d.get("user-num_sta", 0))
-                clients = str(num_sta) if num_sta else "-"
-
-                table.add_row(
-                    device_id,
-                    name,
-                    model,
-                    dev_type,
-                    ip,
-                    mac,
-                    version,
-                    f"[{status_style}]{status}[/{status_style}]",
-                    uptime,
-                    load,
-                    clients,
-                )
-            else:
-                table.add_row(
-                    device_id,
-                    name,
-                    model,
-                    dev_type,
-                    ip,
-                    mac,
-                    version,
-                    f"[{status_style}]{status}[/{status_style}]",
-                    uptime,
-                )
+            table.add_row(*_device_row(d, verbose))
 
         console.print(table)
         console.print(f"\n[dim]{len(devices)} device(s)[/dim]")
@@ -377,39 +361,33 @@ def restart_device(
 ) -> None:
     """Restart/reboot a device."""
 
-    async def _get_device():
-        client = UniFiLocalClient()
-        devices = await client.get_devices()
-        return find_device(devices, identifier)
-
+    # Resolve and restart on one connection, confirming in between
+    api_client = None
     try:
-        device = run_with_spinner(_get_device(), "Finding device...")
-    except LocalAPIError as e:
-        print_error(str(e))
-        raise typer.Exit(1)
+        api_client = UniFiLocalClient(keep_alive=True)
+        devices = run_with_spinner(api_client.get_devices(), "Finding device...")
+        device = find_device(devices, identifier)
 
-    if not device:
-        print_error(f"Device '{identifier}' not found")
-        raise typer.Exit(1)
+        if not device:
+            print_error(f"Device '{identifier}' not found")
+            raise typer.Exit(1)
 
-    name = device.get("name", device.get("mac", identifier))
-    mac = device.get("mac", "")
+        name = device.get("name", device.get("mac", identifier))
+        mac = device.get("mac", "")
 
-    if not yes:
-        confirm = typer.confirm(f"Restart device '{name}'?")
-        if not confirm:
-            console.print("[dim]Cancelled[/dim]")
-            raise typer.Exit(0)
-
-    async def _restart():
-        client = UniFiLocalClient()
-        return await client.restart_device(mac)
+        if not yes:
+            confirm = typer.confirm(f"Restart device '{name}'?")
+            if not confirm:
+                console.print("[dim]Cancelled[/dim]")
+                raise typer.Exit(0)
 
-    try:
-        success = run_with_spinner(_restart(), "Restarting device...")
+        success = run_with_spinner(api_client.restart_device(mac), "Restarting device...")
     except LocalAPIError as e:
         print_error(str(e))
         raise typer.Exit(1)
+    finally:
+        if api_client is not None:
+            run_sync(api_client.close())
 
     if success:
         if output == OutputFormat.JSON:
@@ -435,47 +413,41 @@ def upgrade_device(
 ) -> None:
     """Upgrade device firmware."""
 
-    async def _get_device():
-        client = UniFiLocalClient()
-        devices = await client.get_devices()
-        return find_device(devices, identifier)
-
+    # Resolve and upgrade on one connection, confirming in between
+    api_client = None
     try:
-        device = run_with_spinner(_get_device(), "Finding device...")
-    except LocalAPIError as e:
-        print_error(str(e))
-        raise typer.Exit(1)
+        api_client = UniFiLocalClient(keep_alive=True)
+        devices = run_with_spinner(api_client.get_devices(), "Finding device...")
+        device = find_device(devices, identifier)
 
-    if not device:
-        print_error(f"Device '{identifier}' not found")
-        raise typer.Exit(1)
+        if not device:
+            print_error(f"Device '{identifier}' not found")
+            raise typer.Exit(1)
 
-    name = device.get("name", device.get("mac", identifier))
-    mac = device.get("mac", "")
-    current_version = device.get("version", "unknown")
+        name = device.get("name", device.get("mac", identifier))
+        mac = device.get("mac", "")
+        current_version = device.get("version", "unknown")
 
-    # Check if upgrade is available
-    if not device.get("upgradable", False):
-        console.print(f"[dim]'{name}' is already on the latest firmware ({current_version})[/dim]")
-        return
-
-    upgrade_to = device.get("upgrade_to_firmware", "latest")
+        # Check if upgrade is available
+        if not device.get("upgradable", False):
+            console.print(f"[dim]'{name}' is already on the latest firmware ({current_version})[/dim]")
+            return
 
-    if not yes:
-        confirm = typer.confirm(f"Upgrade '{name}' from {current_version} to {upgrade_to}?")
-        if not confirm:
-            console.print("[dim]Cancelled[/dim]")
-            raise typer.Exit(0)
+        upgrade_to = device.get("upgrade_to_firmware", "latest")
 
-    async def _upgrade():
-        client = UniFiLocalClient()
-        return await client.upgrade_device(mac)
+        if not yes:
+            confirm = typer.confirm(f"Upgrade '{name}' from {current_version} to {upgrade_to}?")
+            if not confirm:
+                console.print("[dim]Cancelled[/dim]")
+                raise typer.Exit(0)
 
-    try:
-        success = run_with_spinner(_upgrade(), "Starting upgrade...")
+        success = run_with_spinner(api_client.upgrade_device(mac), "Starting upgrade...")
     except LocalAPIError as e:
         print_error(str(e))
         raise typer.Exit(1)
+    finally:
+        if api_client is not None:
+            run_sync(api_client.close())
 
     if success:
         print_success(f"Upgrade started for '{name}'")
@@ -495,33 +467,29 @@ def locate_device(
 ) -> None:
     """Flash LED to locate a device."""
 
-    async def _get_device():
-        client = UniFiLocalClient()
-        devices = await client.get_devices()
-        return find_device(devices, identifier)
-
+    # Resolve and set the LED on one connection
+    api_client = None
     try:
-        device = run_with_spinner(_get_device(), "Finding device...")
-    except LocalAPIError as e:
-        print_error(str(e))
-        raise typer.Exit(1)
+        api_client = UniFiLocalClient(keep_alive=True)
+        devices = run_with_spinner(api_client.get_devices(), "Finding device...")
+        device = find_device(devices, identifier)
 
-    if not device:
-        print_error(f"Device '{identifier}' not found")
-        raise typer.Exit(1)
+        if not device:
+            print_error(f"Device '{identifier}' not found")
+            raise typer.Exit(1)
 
-    name = device.get("name", device.get("mac", identifier))
-    mac = device.get("mac", "")
+        name = device.get("name", device.get("mac", identifier))
+        mac = device.get("mac", "")
 
-    async def _locate():
-        client = UniFiLocalClient()
-        return await client.locate_device(mac, enabled=not off)
-
-    try:
-        success = run_with_spinner(_locate(), "Setting locate LED...")
+        success = run_with_spinner(
+            api_client.locate_device(mac, enabled=not off), "Setting locate LED..."
+        )
     except LocalAPIError as e:
         print_error(str(e))
         raise typer.Exit(1)
+    finally:
+        if api_client is not None:
+            run_sync(api_client.close())
 
     if success:
         if off:
@@ -1,10 +1,13 @@
 """DPI (Deep Packet Inspection) commands for local controller."""
 
 import asyncio
+from itertools import chain
+from operator import itemgetter
 from typing import Annotated, Any
 
 import typer
 
+from ui_cli.commands.local.utils import run_with_spinner
 from ui_cli.local_client import LocalAPIError, UniFiLocalClient
 from ui_cli.output import (
     OutputFormat,
@@ -96,27 +99,26 @@ DPI_APPS = {
 }
 
 
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
 def format_bytes(bytes_val: int | float | None) -> str:
     """Format bytes to human-readable form."""
     if not bytes_val or bytes_val == 0:
         return "0 B"
 
-    units = ["B", "KB", "MB", "GB", "TB"]
-    unit_index = 0
     value = float(bytes_val)
+    if value < 1024:
+        return f"{int(value)} B"
 
-    while value >= 1024 and unit_index < len(units) - 1:
-        value /= 1024
-        unit_index += 1
-
-    if unit_index == 0:
-        return f"{int(value)} {units[unit_index]}"
-    return f"{value:.1f} {units[unit_index]}"
+    # Each unit is 2**10 of the one before, so the bit length picks the unit
+    unit_index = min((int(value).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{value / (1 << (10 * unit_index)):.1f} {_BYTE_UNITS[unit_index]}"
 
 
 def get_category_name(cat_id: int) -> str:
     """Get category name from ID."""
-    return DPI_CATEGORIES.get(cat_id, f"Category {cat_id}")
+    return DPI_CATEGORIES.get(cat_id) or f"Category {cat_id}"
 
 
 def get_app_name(app_key: str) -> str:
@@ -137,50 +139,51 @@ def get_app_name(app_key: str) -> str:
 
 def aggregate_dpi_data(dpi_data: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Aggregate DPI data by category or app."""
-    aggregated = {}
+    aggregated: dict[str, dict[str, Any]] = {}
 
     for item in dpi_data:
         # Try to get app name or category
         app = item.get("app")
-        cat = item.get("cat")
-
         if app:
             key = f"app_{app}"
-            name = get_app_name(str(app))
-        elif cat is not None:
-            key = f"cat_{cat}"
-            name = get_category_name(cat)
         else:
-            continue
+            cat = item.get("cat")
+            if cat is None:
+                continue
+            key = f"cat_{cat}"
 
-        if key not in aggregated:
-            aggregated[key] = {
+        entry = aggregated.get(key)
+        if entry is None:
+            # Resolve the display name once per app/category, not per record
+            name = get_app_name(str(app)) if app else get_category_name(cat)
+            entry = aggregated[key] = {
                 "name": name,
                 "rx_bytes": 0,
                 "tx_bytes": 0,
                 "clients": set(),
             }
 
-        aggregated[key]["rx_bytes"] += item.get("rx_bytes", 0)
-        aggregated[key]["tx_bytes"] += item.get("tx_bytes", 0)
+        entry["rx_bytes"] += item.get("rx_bytes", 0)
+        entry["tx_bytes"] += item.get("tx_bytes", 0)
 
         # Track unique clients if available
         mac = item.get("mac")
         if mac:
-            aggregated[key]["clients"].add(mac)
+            entry["clients"].add(mac)
 
     # Convert to list and sort by total bytes
-    result = []
-    for key, data in aggregated.items():
-        result.append({
+    result = [
+        {
             "name": data["name"],
             "rx_bytes": data["rx_bytes"],
             "tx_bytes": data["tx_bytes"],
             "total_bytes": data["rx_bytes"] + data["tx_bytes"],
             "client_count": len(data["clients"]),
-        })
+        }
+        for data in aggregated.values()
+    ]
 
-    result.sort(key=lambda x: x["total_bytes"], reverse=True)
+    result.sort(key=itemgetter("total_bytes"), reverse=True)
     return result
 
 
@@ -196,7 +199,6 @@ def site_dpi(
     ] = 20,
 ) -> None:
     """Show site-level DPI statistics."""
-    from ui_cli.commands.local.utils import run_with_spinner
 
     async def _dpi():
         client = UniFiLocalClient()
@@ -277,33 +279,37 @@ def client_dpi(
     """Show DPI statistics for a specific client."""
 
     async def _dpi():
-        client = UniFiLocalClient()
-        dpi_enabled = await check_dpi_enabled(client)
-
-        # If not a MAC address, try to find by name
-        mac = identifier
-        if ":" not in identifier and "-" not in identifier:
-            # Search for client by name
-            clients = await client.list_clients()
-            all_clients = await client.list_all_clients()
-            all_clients.extend(clients)
+        async with UniFiLocalClient() as client:
+            await client.ensure_authenticated()
+
+            # A MAC address can be queried directly
+            if ":" in identifier or "-" in identifier:
+                dpi_enabled, dpi_data = await asyncio.gather(
+                    check_dpi_enabled(client), client.get_client_dpi(identifier)
+                )
+                return dpi_data, identifier, dpi_enabled
+
+            # Otherwise search known and connected clients by name
+            dpi_enabled, all_clients, clients = await asyncio.gather(
+                check_dpi_enabled(client), client.list_all_clients(), client.list_clients()
+            )
 
+            ident = identifier.lower()
             found = None
-            for c in all_clients:
-                name = c.get("name", c.get("hostname", ""))
-                if name.lower() == identifier.lower():
+            for c in chain(all_clients, clients):
+                name = c.get("name", c.get("hostname", "")).lower()
+                if name == ident:
                     found = c
                     break
-                if identifier.lower() in name.lower():
+                if ident in name:
                     found = c
 
-            if found:
-                mac = found.get("mac", identifier)
-            else:
+            if not found:
                 return None, identifier, dpi_enabled
 
-        dpi_data = await client.get_client_dpi(mac)
-        return dpi_data, mac, dpi_enabled
+            mac = found.get("mac", identifier)
+            dpi_data = await client.get_client_dpi(mac)
+            return dpi_data, mac, dpi_enabled
 
     try:
         dpi_data, mac, dpi_enabled = run_with_spinner(_dpi(), "Fetching client DPI...")
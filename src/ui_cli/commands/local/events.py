@@ -1,10 +1,13 @@
 """Events and alarms commands for local controller."""
 
 import asyncio
+import re
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Annotated, Any
 
 import typer
+from rich.table import Table
 
 from ui_cli.local_client import LocalAPIError, UniFiLocalClient
 from ui_cli.output import (
@@ -21,79 +24,166 @@ app = typer.Typer(name="events", help="Events and alarms management", no_args_is
 alarms_app = typer.Typer(name="alarms", help="Alarm management", no_args_is_help=True)
 app.add_typer(alarms_app, name="alarms")
 
+# Alarm key keywords by severity; critical is checked first
+_CRITICAL_RE = re.compile(r"critical|disconnect|lost|down|offline")
+_WARNING_RE = re.compile(r"warning|rogue|radar|high")
+
+# Rendered severity cells, one per get_alarm_severity result
+_SEVERITY_CELLS = {
+    "critical": "[red]critical[/red]",
+    "warning": "[yellow]warning[/yellow]",
+    "info": "[cyan]info[/cyan]",
+}
+
+
+@lru_cache(maxsize=4096)
+def _format_seconds(seconds: int) -> str:
+    """Format whole Unix seconds; events often share a second."""
+    return datetime.fromtimestamp(seconds, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
 
 def format_timestamp(ts: int | None) -> str:
     """Format Unix timestamp to readable string."""
     if not ts:
         return ""
     try:
-        dt = datetime.fromtimestamp(ts / 1000, tz=timezone.utc)
-        return dt.strftime("%Y-%m-%d %H:%M:%S")
+        return _format_seconds(ts // 1000)
     except (ValueError, OSError):
         return str(ts)
 
 
 def format_event_message(event: dict[str, Any]) -> str:
     """Format event into human-readable message."""
-    key = event.get("key", "")
-    msg = event.get("msg", "")
+    # Fall back to the key when the event has no usable fields
+    return _event_details(event) or _key_title(event.get("key", ""))
+
+
+def _event_details(event: dict[str, Any]) -> str:
+    """Build a message from the event's own fields, or "" if it has none."""
+    get = event.get
 
     # If there's a direct message, use it
-    if msg:
+    if msg := get("msg"):
         return msg
 
     # Build message from event data
     parts = []
 
     # Client events
-    if "user" in event or "client" in event:
-        client_name = event.get("user", event.get("client", ""))
-        if client_name:
-            parts.append(client_name)
+    if client_name := get("user") or get("client"):
+        parts.append(client_name)
 
     # Network/SSID
-    if "ssid" in event:
-        parts.append(f"on {event['ssid']}")
+    if ssid := get("ssid"):
+        parts.append(f"on {ssid}")
 
     # AP name
-    if "ap_name" in event:
-        parts.append(f"via {event['ap_name']}")
+    if ap_name := get("ap_name"):
+        parts.append(f"via {ap_name}")
 
     # Device events
-    if "sw_name" in event:
-        parts.append(event["sw_name"])
-    elif "gw_name" in event:
-        parts.append(event["gw_name"])
+    if device_name := get("sw_name") or get("gw_name"):
+        parts.append(device_name)
+
+    return " ".join(parts)
 
-    if parts:
-        return " ".join(parts)
 
-    # Fallback to key
+@lru_cache(maxsize=1024)
+def _key_title(key: str) -> str:
+    """Turn an event key into a title; the set of keys is small."""
     return key.replace("EVT_", "").replace("_", " ").title()
 
 
-def get_event_type(event: dict[str, Any]) -> str:
-    """Extract event type from event key."""
-    key = event.get("key", "unknown")
+@lru_cache(maxsize=1024)
+def _key_type(key: str) -> str:
+    """Turn an event key into a lowercase type name."""
     # Remove EVT_ prefix and clean up
     if key.startswith("EVT_"):
         key = key[4:]
     return key.lower()
 
 
+def get_event_type(event: dict[str, Any]) -> str:
+    """Extract event type from event key."""
+    return _key_type(event.get("key", "unknown"))
+
+
+def _prepare_event(event: dict[str, Any]) -> tuple[str, str]:
+    """Get an event's type and message, reading its key once."""
+    key = event.get("key")
+    if key is None:
+        return "unknown", _event_details(event) or _key_title("")
+    return _key_type(key), _event_details(event) or _key_title(key)
+
+
 def get_alarm_severity(alarm: dict[str, Any]) -> tuple[str, str]:
     """Get severity display and style for alarm."""
     # Check for severity hints in the alarm
     key = alarm.get("key", "").lower()
 
-    if any(x in key for x in ["critical", "disconnect", "lost", "down", "offline"]):
+    if _CRITICAL_RE.search(key):
         return "critical", "red"
-    elif any(x in key for x in ["warning", "rogue", "radar", "high"]):
+    elif _WARNING_RE.search(key):
         return "warning", "yellow"
     else:
         return "info", "cyan"
 
 
+def print_events_table(typed_events: list[tuple[dict[str, Any], str]]) -> None:
+    """Print (event, event type) pairs as a table with a count."""
+    table = Table(title="Recent Events", show_header=True, header_style="bold cyan")
+    table.add_column("Time", style="dim")
+    table.add_column("Type")
+    table.add_column("Message")
+
+    for event, evt_type in typed_events:
+        time_str = format_timestamp(event.get("time"))
+        message = format_event_message(event)
+        table.add_row(time_str, evt_type, message)
+
+    console.print(table)
+    console.print(f"\n[dim]{len(typed_events)} event(s)[/dim]")
+
+
+def print_alarms_table(alarms: list[dict[str, Any]], include_archived: bool = False) -> None:
+    """Print alarms as a table with active/archived counts."""
+    title = "All Alarms" if include_archived else "Active Alarms"
+    table = Table(title=title, show_header=True, header_style="bold cyan")
+    table.add_column("ID", style="dim")
+    table.add_column("Time", style="dim")
+    table.add_column("Severity")
+    table.add_column("Message")
+    if include_archived:
+        table.add_column("Status")
+
+    active_count = 0
+    archived_count = 0
+    for alarm in alarms:
+        archived = alarm.get("archived")
+        if archived:
+            archived_count += 1
+        else:
+            active_count += 1
+
+        alarm_id = alarm.get("_id", "")
+        time_str = format_timestamp(alarm.get("time"))
+        severity_display = _SEVERITY_CELLS[get_alarm_severity(alarm)[0]]
+        message = format_event_message(alarm)
+
+        if include_archived:
+            status = "[dim]archived[/dim]" if archived else "[green]active[/green]"
+            table.add_row(alarm_id, time_str, severity_display, message, status)
+        else:
+            table.add_row(alarm_id, time_str, severity_display, message)
+
+    console.print(table)
+
+    if include_archived:
+        console.print(f"\n[dim]{active_count} active, {archived_count} archived[/dim]")
+    else:
+        console.print(f"\n[dim]{active_count} active alarm(s)[/dim]")
+
+
 # ========== Events Commands ==========
 
 @app.command("list")
@@ -115,8 +205,8 @@ def list_events(
     from ui_cli.commands.local.utils import run_with_spinner
 
     async def _list():
-        client = UniFiLocalClient()
-        return await client.get_events(limit=limit)
+        async with UniFiLocalClient() as client:
+            return await client.get_events(limit=limit)
 
     try:
         events = run_with_spinner(_list(), "Fetching events...")
@@ -128,10 +218,14 @@ def list_events(
         console.print("[dim]No events found[/dim]")
         return
 
+    # Pair each event with its type once, for the filter and the rows
+    typed_events = [(e, get_event_type(e)) for e in events]
+
     # Filter by type if specified
     if event_type:
         event_type_lower = event_type.lower()
-        events = [e for e in events if event_type_lower in get_event_type(e)]
+        typed_events = [(e, t) for e, t in typed_events if event_type_lower in t]
+        events = [e for e, _ in typed_events]
 
     if output == OutputFormat.JSON:
         output_json(events)
@@ -141,31 +235,18 @@ def list_events(
             ("key", "Type"),
             ("msg", "Message"),
         ]
-        # Transform for CSV
-        csv_data = []
-        for e in events:
-            csv_data.append({
+        # Transform for CSV, streaming rows to the writer
+        csv_rows = (
+            {
                 "time": format_timestamp(e.get("time")),
-                "key": get_event_type(e),
+                "key": evt_type,
                 "msg": format_event_message(e),
-            })
-        output_csv(csv_data, columns)
+            }
+            for e, evt_type in typed_events
+        )
+        output_csv(csv_rows, columns)
     else:
-        from rich.table import Table
-
-        table = Table(title="Recent Events", show_header=True, header_style="bold cyan")
-        table.add_column("Time", style="dim")
-        table.add_column("Type")
-        table.add_column("Message")
-
-        for event in events:
-            time_str = format_timestamp(event.get("time"))
-            evt_type = get_event_type(event)
-            message = format_event_message(event)
-            table.add_row(time_str, evt_type, message)
-
-        console.print(table)
-        console.print(f"\n[dim]{len(events)} event(s)[/dim]")
+        print_events_table(typed_events)
 
 
 # ========== Alarms Commands ==========
@@ -185,8 +266,8 @@ def list_alarms(
     from ui_cli.commands.local.utils import run_with_spinner
 
     async def _list():
-        client = UniFiLocalClient()
-        return await client.get_alarms(archived=include_archived)
+        async with UniFiLocalClient() as client:
+            return await client.get_alarms(archived=include_archived)
 
     try:
         alarms = run_with_spinner(_list(), "Fetching alarms...")
@@ -208,50 +289,19 @@ def list_alarms(
             ("msg", "Message"),
             ("archived", "Archived"),
         ]
-        csv_data = []
-        for a in alarms:
-            csv_data.append({
+        csv_rows = (
+            {
                 "_id": a.get("_id", ""),
                 "time": format_timestamp(a.get("time")),
-                "key": get_event_type(a),
-                "msg": format_event_message(a),
+                "key": evt_type,
+                "msg": message,
                 "archived": "Yes" if a.get("archived") else "No",
-            })
-        output_csv(csv_data, columns)
+            }
+            for a, (evt_type, message) in zip(alarms, map(_prepare_event, alarms))
+        )
+        output_csv(csv_rows, columns)
     else:
-        from rich.table import Table
-
-        title = "All Alarms" if include_archived else "Active Alarms"
-        table = Table(title=title, show_header=True, header_style="bold cyan")
-        table.add_column("ID", style="dim")
-        table.add_column("Time", style="dim")
-        table.add_column("Severity")
-        table.add_column("Message")
-        if include_archived:
-            table.add_column("Status")
-
-        for alarm in alarms:
-            alarm_id = alarm.get("_id", "")
-            time_str = format_timestamp(alarm.get("time"))
-            severity, style = get_alarm_severity(alarm)
-            message = format_event_message(alarm)
-
-            severity_display = f"[{style}]{severity}[/{style}]"
-
-            if include_archived:
-                status = "[dim]archived[/dim]" if alarm.get("archived") else "[green]active[/green]"
-                table.add_row(alarm_id, time_str, severity_display, message, status)
-            else:
-                table.add_row(alarm_id, time_str, severity_display, message)
-
-        console.print(table)
-
-        active_count = sum(1 for a in alarms if not a.get("archived"))
-        if include_archived:
-            archived_count = sum(1 for a in alarms if a.get("archived"))
-            console.print(f"\n[dim]{active_count} active, {archived_count} archived[/dim]")
-        else:
-            console.print(f"\n[dim]{active_count} active alarm(s)[/dim]")
+        print_alarms_table(alarms, include_archived)
 
 
 @alarms_app.command("archive")
@@ -273,8 +323,8 @@ def archive_alarm(
     from ui_cli.commands.local.utils import run_with_spinner
 
     async def _archive():
-        client = UniFiLocalClient()
-        return await client.archive_alarm(alarm_id)
+        async with UniFiLocalClient() as client:
+            return await client.archive_alarm(alarm_id)
 
     try:
         success = run_with_spinner(_archive(), "Archiving alarm...")
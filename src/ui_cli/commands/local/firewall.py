@@ -4,6 +4,7 @@ import asyncio
 from typing import Annotated, Any
 
 import typer
+from rich.table import Table
 
 from ui_cli.local_client import LocalAPIError, UniFiLocalClient
 from ui_cli.output import (
@@ -30,6 +31,30 @@ RULESET_NAMES = {
     "GUEST_LOCAL": "Guest Local",
 }
 
+# Ruleset sort order, following the display order above
+_RULESET_ORDER = {name: i for i, name in enumerate(RULESET_NAMES)}
+
+# Per-prefix rule keys, built once rather than per formatted rule
+_ADDRESS_KEYS = {
+    prefix: (
+        f"{prefix}_network_type",
+        f"{prefix}_address",
+        f"{prefix}_firewallgroup_ids",
+        f"{prefix}_network",
+    )
+    for prefix in ("src", "dst")
+}
+_PORT_KEYS = {prefix: f"{prefix}_port" for prefix in ("src", "dst")}
+
+# Rendered action cells for the known actions; others use format_action
+_ACTION_CELLS = {
+    "accept": "[green]accept[/green]",
+    "drop": "[red]drop[/red]",
+    "reject": "[yellow]reject[/yellow]",
+}
+_ENABLED_CELL = "[green]✓[/green]"
+_DISABLED_CELL = "[dim]✗[/dim]"
+
 
 def format_action(action: str) -> tuple[str, str]:
     """Format action with color."""
@@ -53,28 +78,24 @@ def format_protocol(rule: dict[str, Any]) -> str:
 
 def format_address(rule: dict[str, Any], prefix: str) -> str:
     """Format source or destination address."""
+    get = rule.get
+    net_type_key, address_key, group_key, network_key = _ADDRESS_KEYS[prefix]
+
     # Check for network type
-    net_type = rule.get(f"{prefix}_network_type", "")
-    if net_type == "ADDRv4":
-        addr = rule.get(f"{prefix}_address", "")
-        return addr if addr else "any"
+    if get(net_type_key) == "ADDRv4":
+        return get(address_key) or "any"
 
     # Check for firewall group
-    group = rule.get(f"{prefix}_firewallgroup_ids", [])
-    if group:
+    if group := get(group_key):
         return f"group:{len(group)}"
 
     # Check for specific network
-    network = rule.get(f"{prefix}_network", "")
-    if network:
-        return network
-
-    return "any"
+    return get(network_key) or "any"
 
 
 def format_port(rule: dict[str, Any], prefix: str) -> str:
     """Format port information."""
-    port = rule.get(f"{prefix}_port", "")
+    port = rule.get(_PORT_KEYS[prefix])
     if port:
         return str(port)
     return "*"
@@ -82,11 +103,29 @@ def format_port(rule: dict[str, Any], prefix: str) -> str:
 
 def get_ruleset_order(ruleset: str) -> int:
     """Get sort order for rulesets."""
-    order = ["WAN_IN", "WAN_OUT", "WAN_LOCAL", "LAN_IN", "LAN_OUT", "LAN_LOCAL", "GUEST_IN", "GUEST_OUT", "GUEST_LOCAL"]
-    try:
-        return order.index(ruleset)
-    except ValueError:
-        return 100
+    return _RULESET_ORDER.get(ruleset, 100)
+
+
+def _rule_row(r: dict[str, Any], verbose: bool) -> tuple[str, ...]:
+    """Build a firewall rule table row, with port columns when verbose."""
+    ruleset = r.get("ruleset", "")
+    action = r.get("action", "")
+    action_cell = _ACTION_CELLS.get(action.lower())
+    if action_cell is None:
+        action, action_style = format_action(action)
+        action_cell = f"[{action_style}]{action}[/{action_style}]"
+    row = (
+        r.get("name", "(unnamed)"),
+        RULESET_NAMES.get(ruleset, ruleset),
+        action_cell,
+        format_protocol(r),
+        format_address(r, "src"),
+        format_address(r, "dst"),
+    )
+    enabled = _ENABLED_CELL if r.get("enabled", True) else _DISABLED_CELL
+    if not verbose:
+        return (*row, enabled)
+    return (*row, format_port(r, "src"), format_port(r, "dst"), enabled)
 
 
 @app.command("list")
@@ -108,8 +147,8 @@ def list_rules(
     from ui_cli.commands.local.utils import run_with_spinner
 
     async def _list():
-        client = UniFiLocalClient()
-        return await client.get_firewall_rules()
+        async with UniFiLocalClient() as client:
+            return await client.get_firewall_rules()
 
     try:
         rules = run_with_spinner(_list(), "Fetching firewall rules...")
@@ -124,7 +163,12 @@ def list_rules(
     # Filter by ruleset if specified
     if ruleset:
         ruleset_upper = ruleset.upper()
-        rules = [r for r in rules if r.get("ruleset", "").upper() == ruleset_upper]
+        # Controllers send canonical upper-case names, so compare as-is first
+        rules = [
+            r
+            for r in rules
+            if (name := r.get("ruleset", "")) == ruleset_upper or name.upper() == ruleset_upper
+        ]
         if not rules:
             console.print(f"[dim]No rules found for ruleset '{ruleset}'[/dim]")
             return
@@ -144,9 +188,8 @@ def list_rules(
             ("dst_address", "Destination"),
             ("enabled", "Enabled"),
         ]
-        csv_data = []
-        for r in rules:
-            csv_data.append({
+        csv_rows = (
+            {
                 "name": r.get("name", ""),
                 "ruleset": r.get("ruleset", ""),
                 "action": r.get("action", ""),
@@ -154,11 +197,11 @@ def list_rules(
                 "src_address": format_address(r, "src"),
                 "dst_address": format_address(r, "dst"),
                 "enabled": "Yes" if r.get("enabled", True) else "No",
-            })
-        output_csv(csv_data, columns)
+            }
+            for r in rules
+        )
+        output_csv(csv_rows, columns)
     else:
-        from rich.table import Table
-
         table = Table(title="Firewall Rules", show_header=True, header_style="bold cyan")
         table.add_column("Name")
         table.add_column("Ruleset")
@@ -172,38 +215,7 @@ def list_rules(
         table.add_column("Enabled")
 
         for r in rules:
-            name = r.get("name", "(unnamed)")
-            ruleset_name = RULESET_NAMES.get(r.get("ruleset", ""), r.get("ruleset", ""))
-            action, action_style = format_action(r.get("action", ""))
-            protocol = format_protocol(r)
-            src = format_address(r, "src")
-            dst = format_address(r, "dst")
-            enabled = "[green]✓[/green]" if r.get("enabled", True) else "[dim]✗[/dim]"
-
-            if verbose:
-                src_port = format_port(r, "src")
-                dst_port = format_port(r, "dst")
-                table.add_row(
-                    name,
-                    ruleset_name,
-                    f"[{action_style}]{action}[/{action_style}]",
-                    protocol,
-                    src,
-                    dst,
-                    src_port,
-                    dst_port,
-                    enabled,
-                )
-            else:
-                table.add_row(
-                    name,
-                    ruleset_name,
-                    f"[{action_style}]{action}[/{action_style}]",
-                    protocol,
-                    src,
-                    dst,
-                    enabled,
-                )
+            table.add_row(*_rule_row(r, verbose))
 
         console.print(table)
         console.print(f"\n[dim]{len(rules)} rule(s)[/dim]")
@@ -220,8 +232,8 @@ def list_groups(
     from ui_cli.commands.local.utils import run_with_spinner
 
     async def _list():
-        client = UniFiLocalClient()
-        return await client.get_firewall_groups()
+        async with UniFiLocalClient() as client:
+            return await client.get_firewall_groups()
 
     try:
         groups = run_with_spinner(_list(), "Fetching firewall groups...")
@@ -245,19 +257,17 @@ def list_groups(
             ("group_type", "Type"),
             ("members", "Members"),
         ]
-        csv_data = []
-        for g in groups:
-            members = g.get("group_members", [])
-            csv_data.append({
+        csv_rows = (
+            {
                 "_id": g.get("_id", ""),
                 "name": g.get("name", ""),
                 "group_type": g.get("group_type", ""),
-                "members": ", ".join(members) if members else "",
-            })
-        output_csv(csv_data, columns)
+                "members": ", ".join(g.get("group_members") or ()),
+            }
+            for g in groups
+        )
+        output_csv(csv_rows, columns)
     else:
-        from rich.table import Table
-
         table = Table(title="Firewall Groups", show_header=True, header_style="bold cyan")
         table.add_column("ID", style="dim")
         table.add_column("Name")
@@ -273,11 +283,14 @@ def list_groups(
             type_display = group_type.replace("-", " ").title()
 
             # Format members
-            members = g.get("group_members", [])
-            if len(members) <= 3:
-                members_str = ", ".join(members) if members else "[dim]-[/dim]"
+            members = g.get("group_members") or []
+            hidden = len(members) - 3
+            if not members:
+                members_str = "[dim]-[/dim]"
+            elif hidden <= 0:
+                members_str = ", ".join(members)
             else:
-                members_str = f"{', '.join(members[:3])}... (+{len(members) - 3})"
+                members_str = f"{', '.join(members[:3])}... (+{hidden})"
 
             table.add_row(group_id, name, type_display, members_str)
 
@@ -3,6 +3,7 @@
 from typing import Annotated, Any
 
 import typer
+from rich.table import Table
 
 from ui_cli.commands.local.utils import run_with_spinner
 from ui_cli.local_client import LocalAPIError, UniFiLocalClient
@@ -40,92 +41,69 @@ def format_subsystem_name(subsystem: str) -> str:
     return name_map.get(subsystem.lower(), subsystem.upper())
 
 
+# Bytes/s to MB/s; a power of two, so the product is exact
+_BYTES_TO_MB = 1 / (1024 * 1024)
+
+# Device kind named in "disconnected" notes, by subsystem
+_DISCONNECT_LABELS = {"lan": "switch(es)", "wlan": "AP(s)", "wan": "gateway(s)"}
+
+
+def _wlan_issues(subsystem: dict[str, Any]) -> list[str]:
+    """WLAN specific checks."""
+    num_disabled = subsystem.get("num_disabled", 0)
+    if num_disabled > 0:
+        return [f"WLAN: {num_disabled} AP(s) disabled"]
+    return []
+
+
+def _wan_issues(subsystem: dict[str, Any]) -> list[str]:
+    """WAN specific checks."""
+    uptime = subsystem.get("gw_wan_uptime")
+    if uptime is not None and uptime < 3600:
+        return [f"WAN: Connection recently restored ({uptime // 60} min ago)"]
+    return []
+
+
+def _lan_issues(subsystem: dict[str, Any]) -> list[str]:
+    """LAN specific checks."""
+    num_sw = subsystem.get("num_sw", 0)
+    num_adopted = subsystem.get("num_adopted", 0)
+    if num_sw > 0 and num_adopted < num_sw:
+        return [f"LAN: {num_sw - num_adopted} switch(es) not adopted"]
+    return []
+
+
+_SUBSYSTEM_CHECKS = {"wlan": _wlan_issues, "wan": _wan_issues, "lan": _lan_issues}
+
+
 def extract_issues(health_data: list[dict[str, Any]]) -> list[str]:
     """Extract issues from health data."""
     issues = []
 
     for subsystem in health_data:
-        name = format_subsystem_name(subsystem.get("subsystem", ""))
-        status = subsystem.get("status", "").lower()
         sub_name = subsystem.get("subsystem", "")
+        name = format_subsystem_name(sub_name)
 
         # Check for disconnected devices (common across subsystems)
         num_disconnected = subsystem.get("num_disconnected", 0)
         if num_disconnected > 0:
-            if sub_name == "lan":
-                issues.append(f"{name}: {num_disconnected} switch(es) disconnected")
-            elif sub_name == "wlan":
-                issues.append(f"{name}: {num_disconnected} AP(s) disconnected")
-            elif sub_name == "wan":
-                issues.append(f"{name}: {num_disconnected} gateway(s) disconnected")
-            else:
-                issues.append(f"{name}: {num_disconnected} device(s) disconnected")
+            label = _DISCONNECT_LABELS.get(sub_name, "device(s)")
+            issues.append(f"{name}: {num_disconnected} {label} disconnected")
 
         # Check for pending devices
         num_pending = subsystem.get("num_pending", 0)
         if num_pending > 0:
             issues.append(f"{name}: {num_pending} device(s) pending adoption")
 
-        # WLAN specific checks
-        if sub_name == "wlan":
-            num_disabled = subsystem.get("num_disabled", 0)
-            if num_disabled > 0:
-                issues.append(f"WLAN: {num_disabled} AP(s) disabled")
-
-        # WAN specific checks
-        if sub_name == "wan":
-            if subsystem.get("gw_wan_uptime", float("inf")) < 3600:
-                uptime = subsystem.get("gw_wan_uptime", 0)
-                issues.append(f"WAN: Connection recently restored ({uptime // 60} min ago)")
-
-        # LAN specific checks
-        if sub_name == "lan":
-            num_sw = subsystem.get("num_sw", 0)
-            num_adopted = subsystem.get("num_adopted", 0)
-            if num_sw > 0 and num_adopted < num_sw:
-                pending = num_sw - num_adopted
-                issues.append(f"LAN: {pending} switch(es) not adopted")
+        check = _SUBSYSTEM_CHECKS.get(sub_name)
+        if check is not None:
+            issues.extend(check(subsystem))
 
     return issues
 
 
-@app.callback(invoke_without_command=True)
-def health(
-    ctx: typer.Context,
-    output: Annotated[
-        OutputFormat,
-        typer.Option("--output", "-o", help="Output format"),
-    ] = OutputFormat.TABLE,
-    verbose: Annotated[
-        bool,
-        typer.Option("--verbose", "-v", help="Show additional details"),
-    ] = False,
-) -> None:
-    """Show site health summary."""
-    if ctx.invoked_subcommand is not None:
-        return
-
-    async def _health():
-        client = UniFiLocalClient()
-        return await client.get_health()
-
-    try:
-        health_data = run_with_spinner(_health(), "Checking health...")
-    except LocalAPIError as e:
-        print_error(str(e))
-        raise typer.Exit(1)
-
-    if not health_data:
-        console.print("[dim]No health data available[/dim]")
-        return
-
-    if output == OutputFormat.JSON:
-        output_json(health_data)
-        return
-
-    # Table output
-    from rich.table import Table
-
+def print_health(health_data: list[dict[str, Any]], verbose: bool = False) -> None:
+    """Print the health table, overall status and any issues."""
     console.print()
     console.print("[bold cyan]Site Health[/bold cyan]")
     console.print("─" * 40)
@@ -163,8 +141,8 @@ def health(
             if "num_ap" in subsystem:
                 details.append(f"{subsystem['num_ap']} APs")
             if "tx_bytes-r" in subsystem:
-                tx = subsystem.get("tx_bytes-r", 0) / 1024 / 1024
-                rx = subsystem.get("rx_bytes-r", 0) / 1024 / 1024
+                tx = subsystem.get("tx_bytes-r", 0) * _BYTES_TO_MB
+                rx = subsystem.get("rx_bytes-r", 0) * _BYTES_TO_MB
                 details.append(f"↑{tx:.1f} ↓{rx:.1f} MB/s")
             if "latency" in subsystem:
                 details.append(f"{subsystem['latency']}ms latency")
@@ -193,3 +171,41 @@ def health(
             console.print(f"  • {issue}")
 
     console.print()
+
+
+@app.callback(invoke_without_command=True)
+def health(
+    ctx: typer.Context,
+    output: Annotated[
+        OutputFormat,
+        typer.Option("--output", "-o", help="Output format"),
+    ] = OutputFormat.TABLE,
+    verbose: Annotated[
+        bool,
+        typer.Option("--verbose", "-v", help="Show additional details"),
+    ] = False,
+) -> None:
+    """Show site health summary."""
+    if ctx.invoked_subcommand is not None:
+        return
+
+    async def _health():
+        async with UniFiLocalClient() as client:
+            return await client.get_health()
+
+    try:
+        health_data = run_with_spinner(_health(), "Checking health...")
+    except LocalAPIError as e:
+        print_error(str(e))
+        raise typer.Exit(1)
+
+    if not health_data:
+        console.print("[dim]No health data available[/dim]")
+        return
+
+    if output == OutputFormat.JSON:
+        output_json(health_data)
+        return
+
+    print_health(health_data, verbose)
+
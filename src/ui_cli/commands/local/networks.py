@@ -4,7 +4,9 @@ import asyncio
 from typing import Annotated, Any
 
 import typer
+from rich.table import Table
 
+from ui_cli.commands.local.utils import run_with_spinner
 from ui_cli.local_client import LocalAPIError, UniFiLocalClient
 from ui_cli.output import (
     OutputFormat,
@@ -16,6 +18,12 @@ from ui_cli.output import (
 
 app = typer.Typer(name="networks", help="Network configuration", no_args_is_help=True)
 
+# Boolean settings shown as "Yes" rows in network details, in display order
+_FLAG_ROWS = (
+    ("igmp_snooping", "IGMP Snooping:"),
+    ("dhcpguard_enabled", "DHCP Guard:"),
+)
+
 
 def format_dhcp_range(network: dict[str, Any]) -> str:
     """Format DHCP range for display."""
@@ -27,8 +35,8 @@ def format_dhcp_range(network: dict[str, Any]) -> str:
 
     if start and stop:
         # Extract last octet for compact display
-        start_last = start.split(".")[-1] if "." in start else start
-        stop_last = stop.split(".")[-1] if "." in stop else stop
+        start_last = start.rpartition(".")[2]
+        stop_last = stop.rpartition(".")[2]
         return f".{start_last} - .{stop_last}"
 
     return "Enabled"
@@ -51,6 +59,42 @@ def get_network_purpose(network: dict[str, Any]) -> str:
     return network.get("networkgroup", "LAN")
 
 
+def _network_row(n: dict[str, Any], verbose: bool) -> tuple[str, ...]:
+    """Build a network table row, with gateway and domain when verbose."""
+    get = n.get
+    row = (
+        get("_id", ""),
+        get("name", ""),
+        str(get("vlan", "1")),
+        format_subnet(n),
+        format_dhcp_range(n),
+        get_network_purpose(n),
+    )
+    if not verbose:
+        return row
+
+    subnet = get("ip_subnet")
+    gateway = get("dhcpd_gateway", subnet.partition("/")[0] if subnet else "")
+    return (*row, gateway, get("domain_name", "-"))
+
+
+def find_network(networks: list[dict[str, Any]], identifier: str) -> dict[str, Any] | None:
+    """Find network by ID or name, falling back to a partial name match.
+
+    An exact ID or name match anywhere in the list beats any partial match;
+    otherwise the first partial match in list order wins.
+    """
+    needle = identifier.lower()
+    partial = None
+    for n in networks:
+        name = (n.get("name") or "").lower()
+        if n.get("_id") == identifier or name == needle:
+            return n
+        if partial is None and needle in name:
+            partial = n
+    return partial
+
+
 @app.command("list")
 def list_networks(
     output: Annotated[
@@ -63,11 +107,9 @@ def list_networks(
     ] = False,
 ) -> None:
     """List all networks."""
-    from ui_cli.commands.local.utils import run_with_spinner
-
     async def _list():
-        client = UniFiLocalClient()
-        return await client.get_networks()
+        async with UniFiLocalClient() as client:
+            return await client.get_networks()
 
     try:
         networks = run_with_spinner(_list(), "Fetching networks...")
@@ -75,10 +117,6 @@ def list_networks(
         print_error(str(e))
         raise typer.Exit(1)
 
-    if not networks:
-        console.print("[dim]No networks found[/dim]")
-        return
-
     if output == OutputFormat.JSON:
         output_json(networks)
     elif output == OutputFormat.CSV:
@@ -90,20 +128,21 @@ def list_networks(
             ("purpose", "Purpose"),
             ("dhcpd_enabled", "DHCP"),
         ]
-        csv_data = []
-        for n in networks:
-            csv_data.append({
+        csv_rows = (
+            {
                 "_id": n.get("_id", ""),
                 "name": n.get("name", ""),
                 "vlan": n.get("vlan", "1"),
                 "ip_subnet": n.get("ip_subnet", ""),
                 "purpose": get_network_purpose(n),
                 "dhcpd_enabled": "Yes" if n.get("dhcpd_enabled") else "No",
-            })
-        output_csv(csv_data, columns)
+            }
+            for n in networks
+        )
+        output_csv(csv_rows, columns)
+    elif not networks:
+        console.print("[dim]No networks found[/dim]")
     else:
-        from rich.table import Table
-
         table = Table(title="Networks", show_header=True, header_style="bold cyan")
         table.add_column("ID", style="dim")
         table.add_column("Name")
@@ -116,19 +155,7 @@ def list_networks(
             table.add_column("Domain")
 
         for n in networks:
-            network_id = n.get("_id", "")
-            name = n.get("name", "")
-            vlan = str(n.get("vlan", "1"))
-            subnet = format_subnet(n)
-            dhcp = format_dhcp_range(n)
-            purpose = get_network_purpose(n)
-
-            if verbose:
-                gateway = n.get("dhcpd_gateway", n.get("ip_subnet", "").split("/")[0] if n.get("ip_subnet") else "")
-                domain = n.get("domain_name", "-")
-                table.add_row(network_id, name, vlan, subnet, dhcp, purpose, gateway, domain)
-            else:
-                table.add_row(network_id, name, vlan, subnet, dhcp, purpose)
+            table.add_row(*_network_row(n, verbose))
 
         console.print(table)
         console.print(f"\n[dim]{len(networks)} network(s)[/dim]")
@@ -145,20 +172,9 @@ def get_network(
     """Get network details."""
 
     async def _get():
-        client = UniFiLocalClient()
-        networks = await client.get_networks()
-
-        # Find by ID or name
-        for n in networks:
-            if n.get("_id") == network_id or n.get("name", "").lower() == network_id.lower():
-                return n
-
-        # Partial name match
-        for n in networks:
-            if network_id.lower() in n.get("name", "").lower():
-                return n
-
-        return None
+        async with UniFiLocalClient() as client:
+            networks = await client.get_networks()
+        return find_network(networks, network_id)
 
     try:
         network = run_with_spinner(_get(), "Finding network...")
@@ -175,8 +191,6 @@ def get_network(
         return
 
     # Table output
-    from rich.table import Table
-
     name = network.get("name", "Unknown")
     console.print()
     console.print(f"[bold cyan]Network: {name}[/bold cyan]")
@@ -196,12 +210,13 @@ def get_network(
     subnet = network.get("ip_subnet", "")
     if subnet:
         table.add_row("Subnet:", subnet)
-        gateway = subnet.split("/")[0] if "/" in subnet else ""
+        address, slash, _ = subnet.partition("/")
+        gateway = address if slash else ""
         if gateway:
             # Replace last octet with .1 for gateway
-            parts = gateway.rsplit(".", 1)
-            if len(parts) == 2:
-                gateway = f"{parts[0]}.1"
+            prefix, dot, _ = gateway.rpartition(".")
+            if dot:
+                gateway = f"{prefix}.1"
             table.add_row("Gateway:", network.get("dhcpd_gateway", gateway))
 
     table.add_row("", "")
@@ -220,21 +235,16 @@ def get_network(
         dns1 = network.get("dhcpd_dns1", "")
         dns2 = network.get("dhcpd_dns2", "")
         if dns1:
-            dns_str = dns1
-            if dns2:
-                dns_str += f", {dns2}"
-            table.add_row("DNS:", dns_str)
+            table.add_row("DNS:", f"{dns1}, {dns2}" if dns2 else dns1)
     else:
         table.add_row("DHCP:", "[dim]Disabled[/dim]")
 
     table.add_row("", "")
 
     # Additional settings
-    if network.get("igmp_snooping"):
-        table.add_row("IGMP Snooping:", "Yes")
-
-    if network.get("dhcpguard_enabled"):
-        table.add_row("DHCP Guard:", "Yes")
+    for key, label in _FLAG_ROWS:
+        if network.get(key):
+            table.add_row(label, "Yes")
 
     domain = network.get("domain_name")
     if domain:
@@ -4,7 +4,9 @@ import asyncio
 from typing import Annotated, Any
 
 import typer
+from rich.table import Table
 
+from ui_cli.commands.local.utils import run_with_spinner
 from ui_cli.local_client import LocalAPIError, UniFiLocalClient
 from ui_cli.output import (
     OutputFormat,
@@ -55,6 +57,23 @@ def format_interface(rule: dict[str, Any]) -> str:
     return "WAN"
 
 
+_ENABLED_CELL = "[green]✓[/green]"
+_DISABLED_CELL = "[dim]✗[/dim]"
+
+
+def _forward_row(r: dict[str, Any]) -> tuple[str, ...]:
+    """Build a port forward table row."""
+    return (
+        r.get("name", "(unnamed)"),
+        format_protocol(r),
+        str(r.get("dst_port", "")),
+        "→",
+        format_destination(r),
+        format_interface(r),
+        _ENABLED_CELL if r.get("enabled", True) else _DISABLED_CELL,
+    )
+
+
 @app.command("list")
 def list_port_forwards(
     output: Annotated[
@@ -67,11 +86,9 @@ def list_port_forwards(
     ] = True,
 ) -> None:
     """List port forwarding rules."""
-    from ui_cli.commands.local.utils import run_with_spinner
-
     async def _list():
-        client = UniFiLocalClient()
-        return await client.get_port_forwards()
+        async with UniFiLocalClient() as client:
+            return await client.get_port_forwards()
 
     try:
         rules = run_with_spinner(_list(), "Fetching port forwards...")
@@ -79,16 +96,11 @@ def list_port_forwards(
         print_error(str(e))
         raise typer.Exit(1)
 
-    if not rules:
-        console.print("[dim]No port forwarding rules found[/dim]")
-        return
+    fetched = len(rules)
 
     # Filter disabled if not showing all
     if not all_rules:
         rules = [r for r in rules if r.get("enabled", True)]
-        if not rules:
-            console.print("[dim]No enabled port forwarding rules[/dim]")
-            return
 
     # Sort by name
     rules.sort(key=lambda r: r.get("name", "").lower())
@@ -106,9 +118,8 @@ def list_port_forwards(
             ("fwd_port", "LAN Port"),
             ("pfwd_interface", "Interface"),
         ]
-        csv_data = []
-        for r in rules:
-            csv_data.append({
+        csv_rows = (
+            {
                 "_id": r.get("_id", ""),
                 "name": r.get("name", ""),
                 "enabled": "Yes" if r.get("enabled", True) else "No",
@@ -117,11 +128,16 @@ def list_port_forwards(
                 "fwd": r.get("fwd", ""),
                 "fwd_port": r.get("fwd_port", r.get("dst_port", "")),
                 "pfwd_interface": format_interface(r),
-            })
-        output_csv(csv_data, columns)
+            }
+            for r in rules
+        )
+        output_csv(csv_rows, columns)
+    elif not rules:
+        if fetched:
+            console.print("[dim]No enabled port forwarding rules[/dim]")
+        else:
+            console.print("[dim]No port forwarding rules found[/dim]")
     else:
-        from rich.table import Table
-
         table = Table(title="Port Forwarding Rules", show_header=True, header_style="bold cyan")
         table.add_column("Name")
         table.add_column("Protocol")
@@ -132,22 +148,7 @@ def list_port_forwards(
         table.add_column("Enabled")
 
         for r in rules:
-            name = r.get("name", "(unnamed)")
-            protocol = format_protocol(r)
-            wan_port = str(r.get("dst_port", ""))
-            destination = format_destination(r)
-            interface = format_interface(r)
-            enabled = "[green]✓[/green]" if r.get("enabled", True) else "[dim]✗[/dim]"
-
-            table.add_row(
-                name,
-                protocol,
-                wan_port,
-                "→",
-                destination,
-                interface,
-                enabled,
-            )
+            table.add_row(*_forward_row(r))
 
         console.print(table)
         console.print(f"\n[dim]{len(rules)} rule(s)[/dim]")
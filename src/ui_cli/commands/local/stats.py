@@ -1,11 +1,14 @@
 """Traffic statistics commands for local controller."""
 
 import asyncio
-from datetime import datetime, timezone
+from collections.abc import Iterator
+from datetime import datetime
 from typing import Annotated, Any
 
 import typer
+from rich.table import Table
 
+from ui_cli.commands.local.utils import run_with_spinner
 from ui_cli.local_client import LocalAPIError, UniFiLocalClient
 from ui_cli.output import (
     OutputFormat,
@@ -18,22 +21,21 @@ from ui_cli.output import (
 app = typer.Typer(name="stats", help="Traffic statistics", no_args_is_help=True)
 
 
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
 def format_bytes(bytes_val: int | float | None) -> str:
     """Format bytes to human-readable form."""
     if not bytes_val or bytes_val == 0:
         return "0 B"
 
-    units = ["B", "KB", "MB", "GB", "TB"]
-    unit_index = 0
     value = float(bytes_val)
+    if value < 1024:
+        return f"{int(value)} B"
 
-    while value >= 1024 and unit_index < len(units) - 1:
-        value /= 1024
-        unit_index += 1
-
-    if unit_index == 0:
-        return f"{int(value)} {units[unit_index]}"
-    return f"{value:.1f} {units[unit_index]}"
+    # Each unit is 2**10 of the one before, so the bit length picks the unit
+    unit_index = min((int(value).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{value / (1 << (10 * unit_index)):.1f} {_BYTE_UNITS[unit_index]}"
 
 
 def format_timestamp(ts: int | float | None, include_time: bool = False) -> str:
@@ -44,20 +46,41 @@ def format_timestamp(ts: int | float | None, include_time: bool = False) -> str:
         # Convert milliseconds to seconds if needed
         if ts > 1e12:
             ts = ts / 1000
-        dt = datetime.fromtimestamp(ts, tz=timezone.utc).astimezone()
+        # Naive local time: one conversion, and the system rules still apply
+        # per timestamp so rows on either side of a DST change stay correct
+        dt = datetime.fromtimestamp(ts)
+        date = f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
         if include_time:
-            return dt.strftime("%Y-%m-%d %H:%M")
-        return dt.strftime("%Y-%m-%d")
+            return f"{date} {dt.hour:02d}:{dt.minute:02d}"
+        return date
     except (ValueError, OSError):
         return str(ts)
 
 
 def get_traffic_bytes(stat: dict[str, Any]) -> tuple[int, int]:
     """Extract download/upload bytes from stat record."""
-    # Try WAN stats first (more accurate for internet traffic)
-    rx = stat.get("wan-rx_bytes", 0) or stat.get("rx_bytes", 0)
-    tx = stat.get("wan-tx_bytes", 0) or stat.get("tx_bytes", 0)
-    return int(rx or 0), int(tx or 0)
+    # Try WAN stats first (more accurate for internet traffic), per record:
+    # a zero or missing WAN counter falls back to the overall one
+    get = stat.get
+    return (
+        int(get("wan-rx_bytes") or get("rx_bytes") or 0),
+        int(get("wan-tx_bytes") or get("tx_bytes") or 0),
+    )
+
+
+def _csv_rows(
+    stats: list[dict[str, Any]], time_key: str, include_time: bool
+) -> Iterator[dict[str, Any]]:
+    """Yield CSV rows for stat records, one at a time."""
+    for s in stats:
+        rx, tx = get_traffic_bytes(s)
+        yield {
+            time_key: format_timestamp(s.get("time"), include_time=include_time),
+            "rx_bytes": rx,
+            "tx_bytes": tx,
+            "total_bytes": rx + tx,
+            "num_sta": s.get("num_sta", 0),
+        }
 
 
 @app.command("daily")
@@ -72,11 +95,9 @@ def daily_stats(
     ] = OutputFormat.TABLE,
 ) -> None:
     """Show daily traffic statistics."""
-    from ui_cli.commands.local.utils import run_with_spinner
-
     async def _stats():
-        client = UniFiLocalClient()
-        return await client.get_daily_stats(days=days)
+        async with UniFiLocalClient() as client:
+            return await client.get_daily_stats(days=days)
 
     try:
         stats = run_with_spinner(_stats(), "Fetching daily stats...")
@@ -84,10 +105,6 @@ def daily_stats(
         print_error(str(e))
         raise typer.Exit(1)
 
-    if not stats:
-        console.print("[dim]No daily statistics available[/dim]")
-        return
-
     # Sort by time (most recent first)
     stats.sort(key=lambda s: s.get("time", 0), reverse=True)
 
@@ -101,20 +118,10 @@ def daily_stats(
             ("total_bytes", "Total (bytes)"),
             ("num_sta", "Clients"),
         ]
-        csv_data = []
-        for s in stats:
-            rx, tx = get_traffic_bytes(s)
-            csv_data.append({
-                "date": format_timestamp(s.get("time")),
-                "rx_bytes": rx,
-                "tx_bytes": tx,
-                "total_bytes": rx + tx,
-                "num_sta": s.get("num_sta", 0),
-            })
-        output_csv(csv_data, columns)
+        output_csv(_csv_rows(stats, "date", include_time=False), columns)
+    elif not stats:
+        console.print("[dim]No daily statistics available[/dim]")
     else:
-        from rich.table import Table
-
         table = Table(title="Daily Traffic Statistics", show_header=True, header_style="bold cyan")
         table.add_column("Date")
         table.add_column("Download", justify="right")
@@ -159,11 +166,9 @@ def hourly_stats(
     ] = OutputFormat.TABLE,
 ) -> None:
     """Show hourly traffic statistics."""
-    from ui_cli.commands.local.utils import run_with_spinner
-
     async def _stats():
-        client = UniFiLocalClient()
-        return await client.get_hourly_stats(hours=hours)
+        async with UniFiLocalClient() as client:
+            return await client.get_hourly_stats(hours=hours)
 
     try:
         stats = run_with_spinner(_stats(), "Fetching hourly stats...")
@@ -171,10 +176,6 @@ def hourly_stats(
         print_error(str(e))
         raise typer.Exit(1)
 
-    if not stats:
-        console.print("[dim]No hourly statistics available[/dim]")
-        return
-
     # Sort by time (most recent first)
     stats.sort(key=lambda s: s.get("time", 0), reverse=True)
 
@@ -188,20 +189,10 @@ def hourly_stats(
             ("total_bytes", "Total (bytes)"),
             ("num_sta", "Clients"),
         ]
-        csv_data = []
-        for s in stats:
-            rx, tx = get_traffic_bytes(s)
-            csv_data.append({
-                "time": format_timestamp(s.get("time"), include_time=True),
-                "rx_bytes": rx,
-                "tx_bytes": tx,
-                "total_bytes": rx + tx,
-                "num_sta": s.get("num_sta", 0),
-            })
-        output_csv(csv_data, columns)
+        output_csv(_csv_rows(stats, "time", include_time=True), columns)
+    elif not stats:
+        console.print("[dim]No hourly statistics available[/dim]")
     else:
-        from rich.table import Table
-
         table = Table(title="Hourly Traffic Statistics", show_header=True, header_style="bold cyan")
         table.add_column("Time")
         table.add_column("Download", justify="right")
@@ -1,15 +1,26 @@
 """Utility functions for local commands."""
 
 import asyncio
+import atexit
+import functools
 import os
+from collections.abc import Callable
 from contextlib import contextmanager
 from typing import TypeVar
 
+import typer
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from ui_cli.local_client import LocalAPIError, LocalAuthenticationError, LocalConnectionError
 from ui_cli.output import console
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 T = TypeVar("T")
+F = TypeVar("F", bound=Callable)
 
 # Store timeout override globally for subcommands to access
 _timeout_override: int | None = None
@@ -17,6 +28,9 @@ _timeout_override: int | None = None
 # Quick timeout value in seconds
 QUICK_TIMEOUT = 5
 
+# Shared event loop for synchronous command handlers, created on first use
+_loop: asyncio.AbstractEventLoop | None = None
+
 
 def is_spinner_disabled() -> bool:
     """Check if spinners should be disabled.
@@ -70,6 +84,37 @@ def spinner(message: str = "Connecting..."):
         yield
 
 
+def _close_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Shut down the shared event loop at exit."""
+    if not loop.is_closed():
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Get the shared event loop, creating it on first use.
+
+    Uses uvloop when it is installed, otherwise the asyncio default loop.
+    """
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+        atexit.register(_close_loop, _loop)
+    return _loop
+
+
+def run_sync(coro) -> T:
+    """Run an async coroutine on the shared event loop.
+
+    Unlike asyncio.run, the loop stays open between calls, so a client
+    opened with keep_alive can reuse its connection across several calls.
+
+    Usage:
+        result = run_sync(client.list_clients())
+    """
+    return get_loop().run_until_complete(coro)
+
+
 def run_with_spinner(coro, message: str = "Connecting...") -> T:
     """Run an async coroutine with a spinner.
 
@@ -79,7 +124,34 @@ def run_with_spinner(coro, message: str = "Connecting...") -> T:
         result = run_with_spinner(client.list_clients(), "Fetching clients...")
     """
     if is_spinner_disabled():
-        return asyncio.run(coro)
+        return run_sync(coro)
 
     with spinner(message):
-        return asyncio.run(coro)
+        return run_sync(coro)
+
+
+def handle_local_errors(func: F) -> F:
+    """Decorator that reports API errors from a command and exits with status 1.
+
+    Usage:
+        @app.command("list")
+        @handle_local_errors
+        def list_items(...): ...
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except (typer.Exit, typer.Abort):
+            raise
+        except LocalAuthenticationError as e:
+            console.print(f"[red]Authentication error:[/red] {e.message}")
+        except LocalConnectionError as e:
+            console.print(f"[red]Connection error:[/red] {e.message}")
+        except LocalAPIError as e:
+            console.print(f"[red]API error:[/red] {e.message}")
+        except Exception as e:
+            console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    return wrapper
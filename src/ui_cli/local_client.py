@@ -4,7 +4,10 @@ Supports both UDM-based controllers (using /proxy/network/api/) and
 Cloud Key / self-hosted controllers (using /api/).
 """
 
+import asyncio
 import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from typing import Any
 
@@ -64,6 +67,7 @@ class UniFiLocalClient:
         site: str | None = None,
         verify_ssl: bool | None = None,
         timeout: int | None = None,
+        keep_alive: bool = False,
     ):
         self.controller_url = (controller_url or settings.controller_url).rstrip("/")
         self.username = username or settings.controller_username
@@ -83,6 +87,11 @@ class UniFiLocalClient:
         self._csrf_token: str | None = None
         self._is_udm: bool | None = None  # None = not detected yet
 
+        # Shared HTTP connection, kept open inside "async with" or with keep_alive
+        # (call close() when done)
+        self._keep_alive = keep_alive
+        self._http: httpx.AsyncClient | None = None
+
         if not self.controller_url:
             raise LocalAuthenticationError(
                 "Controller URL not configured. Set UNIFI_CONTROLLER_URL in .env file."
@@ -92,6 +101,39 @@ class UniFiLocalClient:
                 "Controller credentials not configured. Set UNIFI_CONTROLLER_USERNAME and UNIFI_CONTROLLER_PASSWORD in .env file."
             )
 
+    async def __aenter__(self) -> "UniFiLocalClient":
+        """Reuse one HTTP connection for all requests until the block exits."""
+        self._keep_alive = True
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the shared HTTP connection, if open."""
+        self._keep_alive = False
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    @asynccontextmanager
+    async def _http_client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the shared HTTP client when keeping alive, else a one-off client."""
+        if not self._keep_alive:
+            async with httpx.AsyncClient(
+                timeout=self.timeout,
+                verify=self.verify_ssl,
+            ) as client:
+                yield client
+            return
+
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                timeout=self.timeout,
+                verify=self.verify_ssl,
+            )
+        yield self._http
+
     @property
     def api_prefix(self) -> str:
         """Get API prefix based on controller type."""
@@ -189,10 +231,10 @@ class UniFiLocalClient:
 
     async def login(self) -> bool:
         """Authenticate with the controller. Returns True on success."""
-        async with httpx.AsyncClient(
-            timeout=self.timeout,
-            verify=self.verify_ssl,
-        ) as client:
+        async with self._http_client() as client:
+            # Log in without any stale session cookies
+            client.cookies.clear()
+
             # Detect controller type if not known
             if self._is_udm is None:
                 await self._detect_controller_type(client)
@@ -294,11 +336,8 @@ class UniFiLocalClient:
 
         url = f"{self.api_prefix}/{endpoint.lstrip('/')}"
 
-        async with httpx.AsyncClient(
-            timeout=self.timeout,
-            verify=self.verify_ssl,
-            cookies=self._cookies,
-        ) as client:
+        async with self._http_client() as client:
+            client.cookies = self._cookies
             try:
                 response = await client.request(
                     method=method,
@@ -471,26 +510,29 @@ class UniFiLocalClient:
 
     async def get_running_config(self) -> dict[str, Any]:
         """Get full running configuration."""
-        config: dict[str, Any] = {}
+        sections = {
+            "networks": self.get_networks,
+            "wireless": self.get_wlans,
+            "firewall_rules": self.get_firewall_rules,
+            "firewall_groups": self.get_firewall_groups,
+            "port_forwards": self.get_port_forwards,
+            "devices": self.get_devices,
+            "dhcp_reservations": self.get_dhcp_reservations,
+            "traffic_rules": self.get_traffic_rules,
+            "routing": self.get_routing,
+        }
 
         # Fetch each section, handling errors gracefully
-        async def safe_fetch(name: str, func):
+        async def safe_fetch(func):
             try:
-                config[name] = await func()
+                return await func()
             except LocalAPIError:
-                config[name] = []  # Empty list on error
-
-        await safe_fetch("networks", self.get_networks)
-        await safe_fetch("wireless", self.get_wlans)
-        await safe_fetch("firewall_rules", self.get_firewall_rules)
-        await safe_fetch("firewall_groups", self.get_firewall_groups)
-        await safe_fetch("port_forwards", self.get_port_forwards)
-        await safe_fetch("devices", self.get_devices)
-        await safe_fetch("dhcp_reservations", self.get_dhcp_reservations)
-        await safe_fetch("traffic_rules", self.get_traffic_rules)
-        await safe_fetch("routing", self.get_routing)
-
-        return config
+                return []  # Empty list on error
+
+        # Log in once up front so the concurrent fetches share the session
+        await self.ensure_authenticated()
+        results = await asyncio.gather(*(safe_fetch(func) for func in sections.values()))
+        return dict(zip(sections, results))
 
     # ========== Monitoring ==========
 
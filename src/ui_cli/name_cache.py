@@ -0,0 +1,100 @@
+"""Client name -> MAC cache for the local controller.
+
+Resolving a client by name normally requires fetching every known client
+from the controller. Names are stable, so the mapping from the last full
+fetch is kept on disk and reused until it expires.
+
+Storage: ~/.config/ui-cli/client_names.json
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+# Seconds before a cached mapping must be refreshed from the controller
+CACHE_TTL = 24 * 60 * 60
+
+
+class ClientNameCache:
+    """Name -> MAC mappings for one controller, stored in ~/.config/ui-cli/client_names.json"""
+
+    def __init__(self, controller_url: str):
+        self._path = Path.home() / ".config" / "ui-cli" / "client_names.json"
+        self.controller_url = controller_url
+        self._names: dict[str, str] | None = None
+        self._updated_at = 0.0
+
+    @property
+    def names(self) -> dict[str, str]:
+        """Lazy-load the lowercase name -> MAC mapping."""
+        if self._names is None:
+            self._load()
+        return self._names
+
+    def _load(self) -> None:
+        """Load mappings from disk, ignoring stale or foreign entries."""
+        self._names = {}
+        if not self._path.exists():
+            return
+        try:
+            data = json.loads(self._path.read_text())
+        except (json.JSONDecodeError, OSError):
+            return
+        if data.get("controller_url") != self.controller_url:
+            return
+        updated_at = data.get("updated_at", 0)
+        if time.time() - updated_at >= CACHE_TTL:
+            return
+        self._names = data.get("names", {})
+        self._updated_at = updated_at
+
+    def _save(self) -> None:
+        """Save mappings to disk atomically."""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "controller_url": self.controller_url,
+            "updated_at": self._updated_at,
+            "names": self.names,
+        }
+        tmp_path = self._path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data, indent=2))
+        os.replace(tmp_path, self._path)
+
+    def get(self, name: str) -> str | None:
+        """Get the cached MAC for a client name (case-insensitive)."""
+        return self.names.get(name.lower())
+
+    def refresh(self, clients: list[dict]) -> None:
+        """Replace the cache with the names from a full client list.
+
+        Names shared by more than one client are left out, since they
+        cannot be resolved to a single MAC.
+        """
+        names: dict[str, str] = {}
+        shared: set[str] = set()
+        for client in clients:
+            name = (client.get("name") or client.get("hostname") or "").lower()
+            mac = client.get("mac", "").lower()
+            if not name or not mac:
+                continue
+            if name in names:
+                shared.add(name)
+            names[name] = mac
+        for name in shared:
+            del names[name]
+
+        self._names = names
+        self._updated_at = time.time()
+        try:
+            self._save()
+        except OSError:
+            pass
+
+    def discard(self, name: str) -> None:
+        """Drop a mapping that no longer matches the controller."""
+        if self.names.pop(name.lower(), None) is not None:
+            try:
+                self._save()
+            except OSError:
+                pass
@@ -1,8 +1,9 @@
 """Output formatters for table, JSON, and CSV formats."""
 
 import csv
-import io
 import json
+import sys
+from collections.abc import Iterable
 from enum import Enum
 from typing import Any
 
@@ -10,8 +11,19 @@ from rich.console import Console
 from rich.json import JSON
 from rich.table import Table
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 console = Console()
 
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    if orjson is not None
+    else 0
+)
+
 
 class OutputFormat(str, Enum):
     """Available output formats."""
@@ -36,12 +48,56 @@ def flatten_dict(data: dict[str, Any], parent_key: str = "", sep: str = ".") ->
     return dict(items)
 
 
+def dumps_json(data: Any) -> str:
+    """Serialize data as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            # e.g. integers wider than 64 bits; the stdlib encoder handles them
+            pass
+    return json.dumps(data, indent=2, default=str)
+
+
 def output_json(data: Any, verbose: bool = False) -> None:
     """Output data as formatted JSON."""
     if verbose:
-        console.print(JSON(json.dumps(data, indent=2, default=str)))
-    else:
-        print(json.dumps(data, indent=2, default=str))
+        console.print(JSON(dumps_json(data)))
+        return
+
+    buffer = getattr(sys.stdout, "buffer", None)
+    if orjson is not None and buffer is not None:
+        try:
+            payload = orjson.dumps(
+                data, default=str, option=_ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE
+            )
+        except TypeError:
+            pass
+        else:
+            # Write the encoded bytes as-is, skipping the decode and re-encode
+            sys.stdout.flush()
+            buffer.write(payload)
+            buffer.flush()
+            return
+    print(dumps_json(data))
+
+
+def output_json_stream(items: Iterable[Any], verbose: bool = False) -> None:
+    """Output an iterable as a formatted JSON array, one element at a time.
+
+    Produces the same text as output_json without materializing the list.
+    """
+    if verbose:
+        output_json(list(items), verbose=True)
+        return
+
+    write = sys.stdout.write
+    first = True
+    for item in items:
+        text = dumps_json(item).replace("\n", "\n  ")
+        write(("[\n  " if first else ",\n  ") + text)
+        first = False
+    write("[]\n" if first else "\n]\n")
 
 
 def get_nested_value(data: dict[str, Any], key: str) -> Any:
@@ -56,24 +112,21 @@ def get_nested_value(data: dict[str, Any], key: str) -> Any:
 
 
 def output_csv(
-    data: list[dict[str, Any]],
+    data: Iterable[dict[str, Any]],
     columns: list[tuple[str, str]] | None = None,
 ) -> None:
     """Output data as CSV.
 
     Args:
-        data: List of dictionaries to output
+        data: Dictionaries to output. With columns, rows are written as the
+            iterable yields them, so a generator is never materialized.
         columns: Optional list of (key, header) tuples. If None, flattens all fields.
+            With columns, empty data still writes the header row.
     """
-    if not data:
-        return
-
-    output = io.StringIO()
-
     if columns:
-        # Use specified columns with headers
+        # Use specified columns with headers; empty data still gets a header
         headers = [header for _, header in columns]
-        writer = csv.writer(output)
+        writer = csv.writer(sys.stdout)
         writer.writerow(headers)
 
         for item in data:
@@ -93,17 +146,16 @@ def output_csv(
     else:
         # Flatten and output all fields
         flattened = [flatten_dict(item) for item in data]
+        if not flattened:
+            return
         all_keys: set[str] = set()
         for item in flattened:
             all_keys.update(item.keys())
         fieldnames = sorted(all_keys)
 
-        writer = csv.DictWriter(output, fieldnames=fieldnames, extrasaction="ignore")
+        writer = csv.DictWriter(sys.stdout, fieldnames=fieldnames, extrasaction="ignore")
         writer.writeheader()
-        for item in flattened:
-            writer.writerow(item)
-
-    print(output.getvalue(), end="")
+        writer.writerows(flattened)
 
 
 def output_table(
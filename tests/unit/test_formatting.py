@@ -2,10 +2,16 @@
 
 import pytest
 
+from ui_cli.commands.local.clients import format_client, get_experience_category, is_mac_address
+from ui_cli.commands.local.config import redact_secrets, to_yaml
 from ui_cli.commands.local.dpi import format_bytes as dpi_format_bytes, get_category_name, get_app_name
 from ui_cli.commands.local.vouchers import format_duration, format_quota, format_code, is_voucher_expired
-from ui_cli.commands.local.devices import get_device_type, get_device_status, get_uptime
-from ui_cli.commands.local.stats import format_bytes as stats_format_bytes, format_timestamp
+from ui_cli.commands.local.devices import find_device, get_device_type, get_device_status, get_uptime
+from ui_cli.commands.local.events import format_event_message, get_alarm_severity
+from ui_cli.commands.local.firewall import format_address, format_port
+from ui_cli.commands.local.health import extract_issues
+from ui_cli.commands.local.networks import find_network
+from ui_cli.commands.local.stats import format_bytes as stats_format_bytes, format_timestamp, get_traffic_bytes
 
 
 class TestBytesFormatting:
@@ -208,6 +214,120 @@ class TestDeviceFormatting:
         assert "2d" in result
 
 
+
+class TestFindDevice:
+    """Tests for device lookup by identifier."""
+
+    DEVICES = [
+        {"_id": "id1", "mac": "aa:bb:cc:00:00:01", "name": "Office AP", "ip": "10.0.0.2"},
+        {"_id": "id2", "mac": "aa:bb:cc:00:00:02", "name": "Office", "ip": "10.0.0.3"},
+        {"_id": "id3", "mac": "aa:bb:cc:00:00:03", "name": "Core Switch", "ip": "10.0.0.4"},
+    ]
+
+    def test_find_by_id_and_mac(self):
+        """Test lookup by ID and by MAC with colons, dashes or no separators."""
+        assert find_device(self.DEVICES, "id3") is self.DEVICES[2]
+        assert find_device(self.DEVICES, "AA:BB:CC:00:00:02") is self.DEVICES[1]
+        assert find_device(self.DEVICES, "aabbcc000001") is self.DEVICES[0]
+        assert find_device(self.DEVICES, "aa-bb-cc-00-00-03") is self.DEVICES[2]
+
+    def test_exact_name_before_partial(self):
+        """Test an exact name match beats an earlier partial match."""
+        assert find_device(self.DEVICES, "office") is self.DEVICES[1]
+        assert find_device(self.DEVICES, "switch") is self.DEVICES[2]
+
+    def test_find_by_ip_and_missing(self):
+        """Test lookup by IP and a miss."""
+        assert find_device(self.DEVICES, "10.0.0.4") is self.DEVICES[2]
+        assert find_device(self.DEVICES, "nothing") is None
+
+
+class TestFindNetwork:
+    """Tests for network lookup by identifier."""
+
+    NETWORKS = [
+        {"_id": "n1", "name": "IoT Devices"},
+        {"_id": "n2", "name": "IoT"},
+        {"_id": "n3", "name": "Guest"},
+        {"_id": "n4"},
+    ]
+
+    def test_exact_before_partial(self):
+        """Test an exact ID or name match beats an earlier partial match."""
+        assert find_network(self.NETWORKS, "iot") is self.NETWORKS[1]
+        assert find_network(self.NETWORKS, "n4") is self.NETWORKS[3]
+
+    def test_partial_and_missing(self):
+        """Test the first partial match wins and a miss returns None."""
+        assert find_network(self.NETWORKS, "io") is self.NETWORKS[0]
+        assert find_network(self.NETWORKS, "vpn") is None
+
+
+class TestEventFormatting:
+    """Tests for event message formatting."""
+
+    def test_message_from_event_fields(self):
+        """Test a message is built from the client, SSID and AP fields."""
+        event = {"key": "EVT_WU_Connected", "user": "laptop", "ssid": "Home", "ap_name": "Office AP"}
+        assert format_event_message(event) == "laptop on Home via Office AP"
+        assert format_event_message({"msg": "Direct message", "user": "laptop"}) == "Direct message"
+
+    def test_empty_fields_fall_back(self):
+        """Test empty fields are skipped and an empty event falls back to its key."""
+        assert format_event_message({"user": "", "client": "phone", "gw_name": "Gateway"}) == "phone Gateway"
+        assert format_event_message({"key": "EVT_AP_Lost_Contact", "ssid": None}) == "Ap Lost Contact"
+
+    def test_alarm_severity(self):
+        """Test alarm severity from key keywords, with critical taking precedence."""
+        assert get_alarm_severity({"key": "EVT_AP_Lost_Contact"}) == ("critical", "red")
+        assert get_alarm_severity({"key": "EVT_AP_DetectRogueAP"}) == ("warning", "yellow")
+        assert get_alarm_severity({"key": "EVT_HighTemp_Disconnect"}) == ("critical", "red")
+        assert get_alarm_severity({"key": "EVT_IPS_IpsAlert"}) == ("info", "cyan")
+
+
+class TestFirewallFormatting:
+    """Tests for firewall rule formatting."""
+
+    def test_format_address(self):
+        """Test address formatting for IPv4, groups, networks and any."""
+        rule = {
+            "src_network_type": "ADDRv4",
+            "src_address": "10.0.0.0/24",
+            "dst_firewallgroup_ids": ["a", "b"],
+        }
+        assert format_address(rule, "src") == "10.0.0.0/24"
+        assert format_address(rule, "dst") == "group:2"
+        assert format_address({"dst_network": "LAN"}, "dst") == "LAN"
+        assert format_address({"src_network_type": "ADDRv4"}, "src") == "any"
+
+    def test_format_port(self):
+        """Test port formatting with and without a port."""
+        assert format_port({"dst_port": 443}, "dst") == "443"
+        assert format_port({"src_port": ""}, "src") == "*"
+
+
+class TestHealthIssues:
+    """Tests for health issue extraction."""
+
+    def test_extract_issues(self):
+        """Test shared and subsystem-specific issues are reported in order."""
+        health_data = [
+            {"subsystem": "wlan", "num_disconnected": 1, "num_disabled": 2},
+            {"subsystem": "wan", "gw_wan_uptime": 1200},
+            {"subsystem": "lan", "num_pending": 1, "num_sw": 3, "num_adopted": 2},
+            {"subsystem": "vpn", "num_disconnected": 4},
+            {"subsystem": "www", "status": "ok"},
+        ]
+        assert extract_issues(health_data) == [
+            "WLAN: 1 AP(s) disconnected",
+            "WLAN: 2 AP(s) disabled",
+            "WAN: Connection recently restored (20 min ago)",
+            "LAN: 1 device(s) pending adoption",
+            "LAN: 1 switch(es) not adopted",
+            "VPN: 4 device(s) disconnected",
+        ]
+
+
 class TestStatsFormatting:
     """Tests for stats formatting functions."""
 
@@ -232,3 +352,105 @@ class TestStatsFormatting:
         # Should auto-convert from milliseconds
         result = format_timestamp(1700000000000)
         assert result != "-"
+
+    def test_get_traffic_bytes_prefers_wan(self):
+        """Test WAN counters win and zero or missing ones fall back per record."""
+        assert get_traffic_bytes({"wan-rx_bytes": 5, "rx_bytes": 9, "tx_bytes": 3}) == (5, 3)
+        assert get_traffic_bytes({"wan-rx_bytes": 0, "rx_bytes": 9, "wan-tx_bytes": None}) == (9, 0)
+        assert get_traffic_bytes({"rx_bytes": 1.9e3, "tx_bytes": 2}) == (1900, 2)
+
+
+class TestClientHelpers:
+    """Tests for client helper functions."""
+
+    def test_is_mac_address_formats(self):
+        """Test recognized MAC address formats."""
+        assert is_mac_address("AA:BB:CC:DD:EE:FF")
+        assert is_mac_address("aa-bb-cc-dd-ee-ff")
+        assert is_mac_address("aabbccddeeff")
+
+    def test_is_mac_address_rejects_names(self):
+        """Test that names and malformed MACs are rejected."""
+        assert not is_mac_address("my-iPhone")
+        assert not is_mac_address("AA:BB:CC:DD:EE")
+        assert not is_mac_address("AA:BB-CC:DD-EE:FF")
+        assert not is_mac_address("AA:BB:CC:DD:EE:FF\n")
+
+    def test_format_client_all_fields(self):
+        """Test formatting every client field."""
+        result = format_client({
+            "name": "laptop",
+            "mac": "aa:bb:cc:dd:ee:ff",
+            "rssi": -60,
+            "satisfaction": 95,
+            "uptime": 5400,
+            "tx_rate": 866000,
+        })
+        assert result["mac"] == "AA:BB:CC:DD:EE:FF"
+        assert result["signal"] == "-60 dBm"
+        assert result["satisfaction"] == "95%"
+        assert result["uptime"] == "1h 30m"
+        assert result["tx_rate"] == "866 Mbps"
+        assert result["rx_rate"] == ""
+
+    def test_format_client_selected_keys(self):
+        """Test formatting only the requested fields."""
+        result = format_client({"hostname": "printer", "is_wired": True}, ["name", "type"])
+        assert result == {"name": "printer", "type": "Wired"}
+
+    def test_get_experience_category(self):
+        """Test experience score bands and their boundaries."""
+        assert get_experience_category(None) == "Unknown"
+        assert get_experience_category(0) == "Poor (<50%)"
+        assert get_experience_category(49) == "Poor (<50%)"
+        assert get_experience_category(50) == "Fair (50-79%)"
+        assert get_experience_category(79) == "Fair (50-79%)"
+        assert get_experience_category(80) == "Good (80%+)"
+        assert get_experience_category(100) == "Good (80%+)"
+
+
+class TestRedactSecrets:
+    """Tests for config secret redaction."""
+
+    def test_redacts_nested_secret_keys(self):
+        """Test secret keys are redacted at any depth, case-insensitively."""
+        config = {
+            "wireless": [{"name": "Home", "x_passphrase": "hunter2"}],
+            "radius": {"profile": {"Secret": "s3cret", "port": 1812}},
+            "admin_password": "pw",
+        }
+        redact_secrets(config)
+        assert config == {
+            "wireless": [{"name": "Home", "x_passphrase": "********"}],
+            "radius": {"profile": {"Secret": "********", "port": 1812}},
+            "admin_password": "********",
+        }
+
+    def test_redacts_secret_containers(self):
+        """Test a secret key holding a dict or list is replaced whole."""
+        config = {"wpa_psk": {"a": 1}, "passwords": ["x", "y"]}
+        redact_secrets(config)
+        assert config == {"wpa_psk": "********", "passwords": "********"}
+
+    def test_keeps_other_values(self):
+        """Test non-secret keys and values are untouched."""
+        config = {"networks": [{"name": "password-net", "vlan": 10}], "key": "value"}
+        redact_secrets(config)
+        assert config == {"networks": [{"name": "password-net", "vlan": 10}], "key": "value"}
+
+
+class TestToYaml:
+    """Tests for YAML config export."""
+
+    def test_hides_secret_values(self):
+        """Test values naming a secret are hidden, others are kept."""
+        config = {"networks": [{"name": "LAN", "note": "Shared Secret here", "tag": "keyboard"}]}
+        result = to_yaml(config)
+        assert '    note: "********"' in result
+        assert "    tag: keyboard" in result
+
+    def test_show_secrets(self):
+        """Test secrets are kept when hiding is turned off."""
+        config = {"wireless": [{"name": "Home", "x_passphrase": "hunter2"}]}
+        assert "    x_passphrase: hunter2" in to_yaml(config, hide_secrets=False)
+        assert '    x_passphrase: "********"' in to_yaml(config)
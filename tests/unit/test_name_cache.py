@@ -0,0 +1,74 @@
+"""Unit tests for the client name cache."""
+
+import json
+import time
+
+import pytest
+
+from ui_cli.name_cache import CACHE_TTL, ClientNameCache
+
+
+@pytest.fixture
+def cache_file(tmp_path):
+    """Temporary cache file path."""
+    return tmp_path / "client_names.json"
+
+
+def make_cache(cache_file, controller_url="https://192.168.1.1"):
+    """Create a cache instance backed by a temporary file."""
+    cache = ClientNameCache(controller_url)
+    cache._path = cache_file
+    return cache
+
+
+class TestClientNameCache:
+    """Tests for ClientNameCache."""
+
+    def test_empty_cache(self, cache_file):
+        """Test lookups on a missing cache file."""
+        cache = make_cache(cache_file)
+        assert cache.get("my-iphone") is None
+
+    def test_refresh_and_get(self, cache_file):
+        """Test that refreshed names persist across instances."""
+        make_cache(cache_file).refresh([
+            {"name": "My-iPhone", "mac": "AA:BB:CC:DD:EE:01"},
+            {"hostname": "laptop", "mac": "aa:bb:cc:dd:ee:02"},
+        ])
+        cache = make_cache(cache_file)
+        assert cache.get("my-iphone") == "aa:bb:cc:dd:ee:01"
+        assert cache.get("LAPTOP") == "aa:bb:cc:dd:ee:02"
+
+    def test_shared_names_not_cached(self, cache_file):
+        """Test that names used by several clients are skipped."""
+        cache = make_cache(cache_file)
+        cache.refresh([
+            {"name": "iPad", "mac": "aa:bb:cc:dd:ee:01"},
+            {"name": "ipad", "mac": "aa:bb:cc:dd:ee:02"},
+        ])
+        assert cache.get("ipad") is None
+
+    def test_other_controller_ignored(self, cache_file):
+        """Test that entries for another controller are not used."""
+        make_cache(cache_file).refresh([{"name": "laptop", "mac": "aa:bb:cc:dd:ee:02"}])
+        cache = make_cache(cache_file, controller_url="https://10.0.0.1")
+        assert cache.get("laptop") is None
+
+    def test_expired_cache_ignored(self, cache_file):
+        """Test that entries older than the TTL are not used."""
+        make_cache(cache_file).refresh([{"name": "laptop", "mac": "aa:bb:cc:dd:ee:02"}])
+        data = json.loads(cache_file.read_text())
+        data["updated_at"] = time.time() - CACHE_TTL - 1
+        cache_file.write_text(json.dumps(data))
+        assert make_cache(cache_file).get("laptop") is None
+
+    def test_discard(self, cache_file):
+        """Test dropping a stale mapping."""
+        make_cache(cache_file).refresh([{"name": "laptop", "mac": "aa:bb:cc:dd:ee:02"}])
+        make_cache(cache_file).discard("Laptop")
+        assert make_cache(cache_file).get("laptop") is None
+
+    def test_corrupted_file(self, cache_file):
+        """Test that a corrupted cache file is treated as empty."""
+        cache_file.write_text("not json")
+        assert make_cache(cache_file).get("laptop") is None
@@ -1,8 +1,11 @@
 """Unit tests for output formatting utilities."""
 
+import json
+
 import pytest
 
-from ui_cli.output import OutputFormat
+from ui_cli import output
+from ui_cli.output import OutputFormat, dumps_json, output_csv, output_json, output_json_stream
 
 
 class TestOutputFormat:
@@ -19,3 +22,87 @@ class TestOutputFormat:
         assert OutputFormat("table") == OutputFormat.TABLE
         assert OutputFormat("json") == OutputFormat.JSON
         assert OutputFormat("csv") == OutputFormat.CSV
+
+
+class TestOutputJsonStream:
+    """Tests for streamed JSON output."""
+
+    @pytest.mark.parametrize(
+        "items",
+        [
+            [],
+            [{"name": "a"}],
+            [{"name": "a", "tags": ["x", "y"], "meta": {"n": 1}}, {"name": "b\nc"}],
+        ],
+    )
+    def test_matches_output_json(self, capsys, items):
+        """Test that streaming produces the same text as output_json."""
+        output_json(items)
+        expected = capsys.readouterr().out
+        output_json_stream(iter(items))
+        assert capsys.readouterr().out == expected
+
+
+class TestDumpsJson:
+    """Tests for JSON serialization."""
+
+    RECORDS = [{"_id": "a1", "time": 1700000000000, "tags": ["x"], "meta": {"ok": True, "n": None}}, {}]
+
+    def test_matches_stdlib(self):
+        """Test plain records serialize exactly as json.dumps would."""
+        assert dumps_json(self.RECORDS) == json.dumps(self.RECORDS, indent=2, default=str)
+
+    def test_without_orjson(self, monkeypatch):
+        """Test serialization falls back to the stdlib when orjson is missing."""
+        monkeypatch.setattr(output, "orjson", None)
+        assert dumps_json(self.RECORDS) == json.dumps(self.RECORDS, indent=2, default=str)
+
+    def test_wide_integers(self):
+        """Test integers wider than 64 bits are still serialized."""
+        assert dumps_json({"n": 2**70}) == '{\n  "n": 1180591620717411303424\n}'
+
+
+class TestOutputJson:
+    """Tests for JSON output."""
+
+    @pytest.mark.parametrize("data", [TestDumpsJson.RECORDS, {"n": 2**70}, []])
+    def test_writes_dumps_json_text(self, capsys, data):
+        """Test output is the dumps_json text plus a newline."""
+        print("before")
+        output_json(data)
+        assert capsys.readouterr().out == "before\n" + dumps_json(data) + "\n"
+
+    def test_without_orjson(self, capsys, monkeypatch):
+        """Test output falls back to printing when orjson is missing."""
+        monkeypatch.setattr(output, "orjson", None)
+        output_json(TestDumpsJson.RECORDS)
+        assert capsys.readouterr().out == dumps_json(TestDumpsJson.RECORDS) + "\n"
+
+
+class TestOutputCsv:
+    """Tests for CSV output."""
+
+    def test_streams_generator_rows(self, capsys):
+        """Test rows from a generator are written with formatted values."""
+        rows = ({"name": n, "on": n == "a", "tags": [n]} for n in ("a", "b"))
+        output_csv(rows, [("name", "Name"), ("on", "On"), ("tags", "Tags")])
+        assert capsys.readouterr().out.splitlines() == [
+            "Name,On,Tags",
+            'a,Yes,"[""a""]"',
+            'b,No,"[""b""]"',
+        ]
+
+    def test_empty_input_with_columns(self, capsys):
+        """Test empty input with columns writes only the header row."""
+        output_csv(iter([]), [("name", "Name"), ("ip", "IP")])
+        assert capsys.readouterr().out.splitlines() == ["Name,IP"]
+
+    def test_empty_input_without_columns(self, capsys):
+        """Test empty input without columns writes nothing."""
+        output_csv([])
+        assert capsys.readouterr().out == ""
+
+    def test_flattens_without_columns(self, capsys):
+        """Test all fields are flattened and sorted when no columns are given."""
+        output_csv(iter([{"b": 1, "a": {"x": 2}}]))
+        assert capsys.readouterr().out.splitlines() == ["a.x,b", "2,1"]